@@ -1,20 +1,37 @@
 """AWSW WordClock integration."""
 
 import logging
-import asyncio
-import voluptuous as vol
-import homeassistant.helpers.config_validation as cv
+import time
 
-from datetime import timedelta
 from homeassistant.core import HomeAssistant
-from homeassistant.helpers.event import async_track_time_interval
-from homeassistant.helpers.aiohttp_client import async_get_clientsession
 from homeassistant.config_entries import ConfigEntry
-
-from .const import DOMAIN
+from homeassistant.helpers.dispatcher import async_dispatcher_send
+
+from .client import WordClockClient
+from .const import (
+    DEFAULT_COLOR_POLLING_TIME,
+    DATA_FLEET,
+    DATA_STORE,
+    DOMAIN,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_POLLING_TIME,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    DEFAULT_MAX_CONNECTIONS,
+    LANGUAGE_WORDS,
+    SIGNAL_CLOCKS_CHANGED,
+    words_for_language,
+)
+from .coordinator import WordClockCoordinator
+from .fleet import FleetScheduler
+from .light import async_change_language, async_enabled_words
+from .services import async_setup_services
+from .storage import StateStore
 
 LOGGER = logging.getLogger(__name__)
-PLATFORMS = ["light"]
+PLATFORMS = ["light", "sensor"]
+# A group entry spans the clocks of other entries and only has a light.
+GROUP_PLATFORMS = ["light"]
 
 ####
 # Options Update
@@ -23,10 +40,12 @@ async def update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     """
     Update integration options without a full reload when possible.
 
-    If the language option changes, cancel any polling tasks, update the stored language,
-    and trigger a full reload of the integration. If only the polling time changes,
-    cancel the current polling task and reschedule it with the new interval.
+    If the language option changes, only the word lights whose word differs
+    are renamed, added or removed. If the polling time changes, restart the
+    coordinator's refresh schedule with the new interval.
     """
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
     # Get current and new polling intervals
     current_polling_time = hass.data[DOMAIN][entry.entry_id].get("polling_time", 5)
     new_polling_time = entry.options.get("polling_time", 5)
@@ -35,58 +54,41 @@ async def update_options(hass: HomeAssistant, entry: ConfigEntry) -> None:
     current_language = hass.data[DOMAIN][entry.entry_id].get("language")
     new_language = entry.options.get("language")
 
-    # If language has changed, perform a full reload
-    if current_language is not None and new_language != current_language:
-        LOGGER.debug("Language changed from %s to %s, performing full reload", current_language, new_language)
+    # If language has changed, update the word lights in place
+    if current_language is not None and new_language is not None and new_language != current_language:
+        LOGGER.debug("Language changed from %s to %s, updating word lights", current_language, new_language)
         hass.data[DOMAIN][entry.entry_id]["language"] = new_language
-        # Cancel existing polling task (if any)
-        if "polling_canceller" in hass.data[DOMAIN][entry.entry_id]:
-            LOGGER.debug("Cancelling existing polling task due to language change")
-            hass.data[DOMAIN][entry.entry_id]["polling_canceller"]()
-            hass.data[DOMAIN][entry.entry_id].pop("polling_canceller", None)
-        await hass.config_entries.async_reload(entry.entry_id)
+        await async_change_language(hass, entry, current_language, new_language)
+
+    # The connection budget sizes the client's connection pool; reload to apply it.
+    if entry.options.get("max_connections", DEFAULT_MAX_CONNECTIONS) != coordinator.client.max_connections:
+        LOGGER.debug("Connection budget changed, reloading WordClock %s", entry.data["ip_address"])
+        hass.config_entries.async_schedule_reload(entry.entry_id)
         return
 
-    # If polling time remains unchanged, no update is needed.
-    if current_polling_time == new_polling_time:
+    # These settings are read on every request or pass, so they can be applied directly.
+    coordinator.client.connect_timeout = entry.options.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+    coordinator.client.read_timeout = entry.options.get("read_timeout", DEFAULT_READ_TIMEOUT)
+    coordinator.client.retries = entry.options.get("retries", DEFAULT_RETRIES)
+    color_polling_time = entry.options.get("color_polling_time", DEFAULT_COLOR_POLLING_TIME)
+    if color_polling_time != coordinator.color_polling_time:
+        coordinator.color_polling_time = color_polling_time
+        coordinator.async_invalidate_colors()
+
+    # If the polling intervals remain unchanged, no update is needed.
+    new_max_polling_time = entry.options.get("max_polling_time", DEFAULT_MAX_POLLING_TIME)
+    if (current_polling_time == new_polling_time
+            and coordinator.max_polling_time == max(new_polling_time, new_max_polling_time)):
         LOGGER.debug("Polling time unchanged (%s seconds); no update needed", new_polling_time)
         return
 
-    # Update the stored polling time.
+    # Update the stored polling time and reschedule the device refresh.
     LOGGER.debug("Updating polling_time from %s to %s", current_polling_time, new_polling_time)
     hass.data[DOMAIN][entry.entry_id]["polling_time"] = new_polling_time
+    coordinator.async_start(new_polling_time, new_max_polling_time)
 
-    # Cancel the current polling task if one exists before rescheduling.
-    if "polling_canceller" in hass.data[DOMAIN][entry.entry_id]:
-        LOGGER.debug("Cancelling existing polling task")
-        hass.data[DOMAIN][entry.entry_id]["polling_canceller"]()
-        hass.data[DOMAIN][entry.entry_id].pop("polling_canceller", None)
-
-    # If light entities are available, reschedule polling with the new interval.
-    if ("entities" in hass.data[DOMAIN][entry.entry_id] and
-            "light" in hass.data[DOMAIN][entry.entry_id]["entities"]):
-        lights = hass.data[DOMAIN][entry.entry_id]["entities"]["light"]
-
-        async def update_light(light):
-            try:
-                await light.async_update()
-                light.async_write_ha_state()
-            except Exception as e:
-                LOGGER.error("Error updating light %s: %s", light.entity_id, e)
-
-        async def update_all(now):
-            # Always grab the latest interval value
-            current_poll = hass.data[DOMAIN][entry.entry_id].get("polling_time", 5)
-            LOGGER.debug("Polling WordClock (all lights) using interval: %s seconds", current_poll)
-            # Update all lights concurrently
-            await asyncio.gather(*(update_light(light) for light in lights))
-
-        LOGGER.info("Setting up new polling with interval of %s seconds", new_polling_time)
-        canceller = async_track_time_interval(hass, update_all, timedelta(seconds=new_polling_time))
-        hass.data[DOMAIN][entry.entry_id]["polling_canceller"] = canceller
-
-        # Optionally, trigger an immediate update after rescheduling.
-        await update_all(None)
+    # Trigger an immediate update after rescheduling.
+    await coordinator.async_refresh()
 
 ####
 # Standard Setup and Entry Functions
@@ -95,110 +97,102 @@ async def async_setup(hass: HomeAssistant, config) -> bool:
     """Set up the AWSW WordClock component."""
     # Initialize the integration data storage
     hass.data.setdefault(DOMAIN, {})
+    # One fleet scheduler staggers the polls of all configured clocks.
+    hass.data[DOMAIN][DATA_FLEET] = FleetScheduler()
+    # The last known state of every clock is kept across restarts.
+    store = StateStore(hass)
+    await store.async_load()
+    hass.data[DOMAIN][DATA_STORE] = store
+    # Services are shared by all entries and resolve entities via an index.
+    await async_setup_services(hass)
     return True
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Set up AWSW WordClock from a configuration entry."""
-    session = async_get_clientsession(hass)
+    if entry.data.get("group"):
+        hass.data[DOMAIN][entry.entry_id] = {"group": True}
+        await hass.config_entries.async_forward_entry_setups(entry, GROUP_PLATFORMS)
+        return True
+
+    started = time.monotonic()
     # Retrieve polling time and language from the entry options (or use defaults)
     polling_time = entry.options.get("polling_time", 5)
     language = entry.options.get("language", entry.data.get("language", "German"))
+    client = WordClockClient(
+        entry.data["ip_address"],
+        connect_timeout=entry.options.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT),
+        read_timeout=entry.options.get("read_timeout", DEFAULT_READ_TIMEOUT),
+        retries=entry.options.get("retries", DEFAULT_RETRIES),
+        max_connections=entry.options.get("max_connections", DEFAULT_MAX_CONNECTIONS),
+    )
+    fleet = hass.data[DOMAIN][DATA_FLEET]
+    coordinator = WordClockCoordinator(
+        hass,
+        client,
+        color_polling_time=entry.options.get("color_polling_time", DEFAULT_COLOR_POLLING_TIME),
+        fleet=fleet,
+        fleet_key=entry.entry_id,
+    )
+    fleet.register(entry.entry_id, coordinator)
+    if language not in LANGUAGE_WORDS:
+        LOGGER.error("Language '%s' not found. Using default (German).", language)
+    # Words whose light is disabled in the entity registry are not polled.
+    coordinator.async_set_words(async_enabled_words(hass, entry, words_for_language(language)))
+    # Start from the state stored before the last restart; the first refresh
+    # reconciles it with the device in the background.
+    hass.data[DOMAIN][DATA_STORE].async_register(entry.entry_id, coordinator)
 
     # Create and store integration state data
     hass.data[DOMAIN][entry.entry_id] = {
-        "session": session,
+        "coordinator": coordinator,
         "polling_time": polling_time,
         "language": language,
-        "entities": {}  # This will later be populated by platforms (e.g., light)
     }
 
+    # The first refresh runs while the platforms create their entities; they
+    # briefly wait for its /status, so the entities start with the real state.
+    coordinator.async_start_first_refresh()
+
     # Register a listener to update integration options on the fly.
-    entry.add_update_listener(update_options)
+    entry.async_on_unload(entry.add_update_listener(update_options))
 
-    # Forward setup to each supported platform (here: light)
+    # Forward setup to each supported platform (here: light); the platforms
+    # register their entities with the coordinator.
     await hass.config_entries.async_forward_entry_setups(entry, PLATFORMS)
 
-    # Allow a brief pause so that platforms can register their entities.
-    await asyncio.sleep(0.1)
-    entities = hass.data[DOMAIN][entry.entry_id].get("entities", {})
-    lights = entities.get("light", [])
-    if lights:
-        async def update_light(light):
-            try:
-                await light.async_update()
-                light.async_write_ha_state()
-            except Exception as e:
-                LOGGER.error("Error updating light %s: %s", light.entity_id, e)
-
-        async def update_all(now):
-            current_poll = hass.data[DOMAIN][entry.entry_id].get("polling_time", 5)
-            LOGGER.debug("Polling WordClock (all lights) using interval: %s seconds", current_poll)
-            await asyncio.gather(*(update_light(light) for light in lights))
-
-        LOGGER.info("Setting up polling for WordClock with interval of %s seconds", polling_time)
-        # Only schedule polling if not already scheduled
-        if "polling_canceller" not in hass.data[DOMAIN][entry.entry_id]:
-            canceller = async_track_time_interval(hass, update_all, timedelta(seconds=polling_time))
-            hass.data[DOMAIN][entry.entry_id]["polling_canceller"] = canceller
-
-    ####
-    # Service Registration (optional)
-    ####
-    async def set_word_color(call):
-        """
-        Handle the service call to set the word color (and optionally brightness).
-
-        It searches through the stored entities (by iterating over the integration's data)
-        for a matching entity_id, then calls async_turn_on with the proper parameters.
-        """
-        entity_id = call.data.get("entity_id")
-        rgb_color = call.data.get("rgb_color")
-        brightness = call.data.get("brightness")  # Optional parameter
-
-        if not entity_id or not rgb_color:
-            LOGGER.error("Missing required service parameters: entity_id or rgb_color")
-            return
-
-        # Iterate through the components to find the matching entity.
-        for component in hass.data.get(DOMAIN, {}).values():
-            if isinstance(component, dict) and "entities" in component:
-                for entity_list in component["entities"].values():
-                    for entity in entity_list:
-                        if entity.entity_id == entity_id and hasattr(entity, "async_turn_on"):
-                            LOGGER.debug("Setting color for %s to %s with brightness %s", entity_id, rgb_color, brightness)
-                            kwargs = {"rgb_color": rgb_color}
-                            if brightness is not None:
-                                kwargs["brightness"] = brightness
-                            await entity.async_turn_on(**kwargs)
-                            return
-
-        LOGGER.error("Entity %s not found or doesn't support color/brightness", entity_id)
-
-    # Register the service under the integration's domain.
-    hass.services.async_register(
-        DOMAIN,
-        "set_word_color",
-        set_word_color,
-        schema=vol.Schema({
-            vol.Required("entity_id"): cv.entity_id,
-            vol.Required("rgb_color"): vol.All(
-                vol.ExactSequence((cv.byte, cv.byte, cv.byte)),
-                vol.Coerce(tuple),
-            ),
-            vol.Optional("brightness"): vol.All(vol.Coerce(int), vol.Range(min=0, max=255)),
-        })
+    # The coordinator is the single refresh scheduler for this device; the
+    # entities do not poll and receive its snapshots as push updates.
+    coordinator.async_start(
+        polling_time, entry.options.get("max_polling_time", DEFAULT_MAX_POLLING_TIME)
     )
 
+    # Let group lights pick up the new clock.
+    async_dispatcher_send(hass, SIGNAL_CLOCKS_CHANGED)
+
+    LOGGER.info("Set up WordClock %s with %d entities in %.3f seconds",
+                entry.data["ip_address"], len(coordinator.entities), time.monotonic() - started)
     return True
 
 async def async_unload_entry(hass: HomeAssistant, entry: ConfigEntry) -> bool:
     """Unload a configuration entry."""
     # Unload all platforms that were forwarded.
+    if entry.data.get("group"):
+        unloaded = await hass.config_entries.async_unload_platforms(entry, GROUP_PLATFORMS)
+        if unloaded:
+            hass.data[DOMAIN].pop(entry.entry_id, None)
+        return unloaded
     unloaded = await hass.config_entries.async_unload_platforms(entry, PLATFORMS)
     if unloaded:
-        # If a polling task is active, cancel it during unload.
+        # Stop the device refresh schedule during unload.
         entry_data = hass.data[DOMAIN].pop(entry.entry_id, {})
-        if "polling_canceller" in entry_data:
-            LOGGER.debug("Cancelling polling task during unload")
-            entry_data["polling_canceller"]()
-    return unloaded
\ No newline at end of file
+        hass.data[DOMAIN][DATA_FLEET].unregister(entry.entry_id)
+        hass.data[DOMAIN][DATA_STORE].async_unregister(entry.entry_id)
+        if "coordinator" in entry_data:
+            await entry_data["coordinator"].async_shutdown()
+        async_dispatcher_send(hass, SIGNAL_CLOCKS_CHANGED)
+    return unloaded
+
+async def async_remove_entry(hass: HomeAssistant, entry: ConfigEntry) -> None:
+    """Forget the stored state of a removed configuration entry."""
+    if DATA_STORE in hass.data.get(DOMAIN, {}):
+        hass.data[DOMAIN][DATA_STORE].async_remove(entry.entry_id)
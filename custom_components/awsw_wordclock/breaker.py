@@ -0,0 +1,48 @@
+"""Circuit breaker for unreachable WordClocks."""
+import logging
+from typing import Optional
+
+from .const import DEFAULT_FAILURE_THRESHOLD
+
+LOGGER = logging.getLogger(__name__)
+
+
+class CircuitBreaker:
+    """Track consecutive request failures of one device.
+
+    The breaker opens after `threshold` consecutive failures and closes again
+    on the first success. Each transition is logged exactly once; the
+    individual failures are only logged at debug level.
+    """
+
+    def __init__(self, name: str, threshold: int = DEFAULT_FAILURE_THRESHOLD) -> None:
+        """Initialize the breaker in the closed state."""
+        self.name = name
+        self.threshold = threshold
+        self.failures = 0
+        self.is_open = False
+        self.last_error: Optional[str] = None
+
+    def record_success(self) -> bool:
+        """Record a successful request; return True if the breaker closed."""
+        self.failures = 0
+        self.last_error = None
+        if not self.is_open:
+            return False
+        self.is_open = False
+        LOGGER.info("WordClock %s is reachable again", self.name)
+        return True
+
+    def record_failure(self, error: Exception) -> bool:
+        """Record a failed request; return True if the breaker opened."""
+        self.failures += 1
+        self.last_error = str(error)
+        LOGGER.debug("Request to WordClock %s failed (%d in a row): %s", self.name, self.failures, error)
+        if self.is_open or self.failures < self.threshold:
+            return False
+        self.is_open = True
+        LOGGER.warning(
+            "WordClock %s is unavailable after %d failed requests, last error: %s",
+            self.name, self.failures, error,
+        )
+        return True
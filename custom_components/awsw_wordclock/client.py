@@ -0,0 +1,109 @@
+"""HTTP client for the AWSW WordClock API."""
+import asyncio
+import logging
+import random
+from typing import Optional
+
+import aiohttp
+
+from .const import (
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+)
+
+LOGGER = logging.getLogger(__name__)
+
+# Base delay in seconds before a retry; doubled per attempt, plus jitter.
+RETRY_BACKOFF = 0.25
+
+
+class WordClockRequestError(Exception):
+    """Raised when a request to the WordClock fails."""
+
+
+class WordClockClient:
+    """Dedicated HTTP client for one WordClock.
+
+    Each clock gets its own keep-alive session limited to a few connections,
+    and every request is bounded by connect and read timeouts, so a hung clock
+    cannot stall a poll cycle for longer than
+    (retries + 1) * (connect_timeout + read_timeout) plus the retry delays.
+    """
+
+    def __init__(
+        self,
+        host: str,
+        port: int = 2023,
+        connect_timeout: float = DEFAULT_CONNECT_TIMEOUT,
+        read_timeout: float = DEFAULT_READ_TIMEOUT,
+        retries: int = DEFAULT_RETRIES,
+        max_connections: int = DEFAULT_MAX_CONNECTIONS,
+    ) -> None:
+        """Initialize the client; the session is created on first use."""
+        self.host = host
+        self.port = port
+        self.connect_timeout = connect_timeout
+        self.read_timeout = read_timeout
+        self.retries = retries
+        self.max_connections = max_connections
+        self._session: Optional[aiohttp.ClientSession] = None
+        self._closed = False
+
+    @property
+    def base_url(self) -> str:
+        """Return the base URL of the device API."""
+        return f"http://{self.host}:{self.port}"
+
+    def _get_session(self) -> aiohttp.ClientSession:
+        if self._session is None or self._session.closed:
+            connector = aiohttp.TCPConnector(
+                limit_per_host=self.max_connections,
+                keepalive_timeout=30,
+            )
+            self._session = aiohttp.ClientSession(connector=connector)
+        return self._session
+
+    async def async_get(self, path: str) -> str:
+        """GET a device path like "/status" and return the response text.
+
+        Raises WordClockRequestError once all attempts have failed, or right
+        away once the client was closed.
+        """
+        if self._closed:
+            raise WordClockRequestError(f"Client for {self.host} is closed")
+        url = f"{self.base_url}{path}"
+        timeout = aiohttp.ClientTimeout(
+            total=self.connect_timeout + self.read_timeout,
+            sock_connect=self.connect_timeout,
+            sock_read=self.read_timeout,
+        )
+        attempt = 0
+        while True:
+            try:
+                async with self._get_session().get(url, timeout=timeout) as response:
+                    if response.status != 200:
+                        raise WordClockRequestError(f"HTTP {response.status} from {url}")
+                    return await response.text()
+            except (aiohttp.ClientError, asyncio.TimeoutError, WordClockRequestError) as e:
+                if attempt >= self.retries:
+                    if isinstance(e, WordClockRequestError):
+                        raise
+                    raise WordClockRequestError(
+                        f"Error requesting {url}: {e!r}"
+                    ) from e
+            attempt += 1
+            # Spread the retries of many clocks instead of retrying in lockstep.
+            delay = RETRY_BACKOFF * 2 ** (attempt - 1)
+            await asyncio.sleep(delay + random.uniform(0, delay))
+            if self._closed:
+                raise WordClockRequestError(f"Client for {self.host} is closed")
+            LOGGER.debug("Retrying %s (attempt %d of %d)", url, attempt, self.retries)
+
+    async def async_close(self) -> None:
+        """Close the underlying session; later requests fail instead of reopening it."""
+        self._closed = True
+        if self._session is not None:
+            await self._session.close()
+            self._session = None
@@ -0,0 +1,158 @@
+"""Write-coalescing command queue for the AWSW WordClock integration."""
+import asyncio
+import logging
+import time
+from typing import Awaitable, Callable, Dict, List, Set
+
+from homeassistant.core import HomeAssistant, callback
+
+from .const import DEFAULT_COMMAND_INTERVAL
+
+LOGGER = logging.getLogger(__name__)
+
+# Write target of /config parameters; words are targets by their id.
+CONFIG_TARGET = "config"
+
+
+class CommandQueue:
+    """Collapse pending writes per target and send them at a capped rate.
+
+    Pending /config parameters (Time, Back and INTENSITY) are merged into a
+    single URL, and pending /ew/ parameters are merged per word, so a burst of
+    color or brightness changes only sends the latest value for each target.
+    Every caller receives a future that resolves once the request carrying its
+    value has been sent.
+
+    Animation frames are queued the same way but do not count as changes:
+    they leave the generations alone and are sent without marking the device
+    active, so polls of the other targets go on while an effect runs.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        name: str,
+        send: Callable[..., Awaitable[bool]],
+        min_interval: float = DEFAULT_COMMAND_INTERVAL,
+    ) -> None:
+        """Initialize the command queue."""
+        self.hass = hass
+        self.name = name
+        self.min_interval = min_interval
+        self._send = send
+        self._config: Dict[str, int] = {}
+        self._config_waiters: List[asyncio.Future] = []
+        self._words: Dict[int, Dict[str, int]] = {}
+        self._word_waiters: Dict[int, List[asyncio.Future]] = {}
+        self._last_sent = 0.0
+        self._task = None
+        self.coalesced = 0
+        # Incremented per target on every queued write so readers can detect stale polls.
+        self._generations: Dict[object, int] = {}
+        # Targets with a pending write that is not a frame, and the ones being sent.
+        self._changing: Set[object] = set()
+        self._sending: Set[object] = set()
+
+    @property
+    def pending(self) -> bool:
+        """Return True while writes are waiting to be sent."""
+        return bool(self._config or self._words)
+
+    def generation(self, target) -> int:
+        """Return the number of writes queued for a target so far."""
+        return self._generations.get(target, 0)
+
+    def busy_with(self, target) -> bool:
+        """Return True while a write to a target (other than a frame) is pending or being sent."""
+        return target in self._changing or target in self._sending
+
+    def async_send_config(self, params: Dict[str, int], frame: bool = False) -> asyncio.Future:
+        """Queue /config parameters; they are merged with any pending ones."""
+        if self._config:
+            self.coalesced += 1
+        self._config.update(params)
+        return self._async_enqueue(CONFIG_TARGET, self._config_waiters, frame)
+
+    def async_send_word(self, word_id: int, params: Dict[str, int], frame: bool = False) -> asyncio.Future:
+        """Queue /ew/ parameters for a word; they replace pending ones for that word."""
+        pending = self._words.setdefault(word_id, {})
+        if pending:
+            self.coalesced += 1
+        pending.update(params)
+        # Turning a word off makes a pending color change irrelevant.
+        if params.get(f"ew{word_id}") == 0 and "R" not in params:
+            for channel in ("R", "G", "B"):
+                pending.pop(channel, None)
+        return self._async_enqueue(word_id, self._word_waiters.setdefault(word_id, []), frame)
+
+    @callback
+    def async_cancel(self) -> None:
+        """Drop all pending writes and stop the worker."""
+        if self._task is not None:
+            self._task.cancel()
+            self._task = None
+        self._config = {}
+        self._words = {}
+        self._changing.clear()
+        self._sending.clear()
+        waiters = self._config_waiters + [w for ws in self._word_waiters.values() for w in ws]
+        self._config_waiters = []
+        self._word_waiters = {}
+        for waiter in waiters:
+            if not waiter.done():
+                waiter.set_result(False)
+
+    def _async_enqueue(self, target, waiters: List[asyncio.Future], frame: bool) -> asyncio.Future:
+        """Register a waiter and make sure the worker is running."""
+        if not frame:
+            self._generations[target] = self.generation(target) + 1
+            self._changing.add(target)
+        waiter = self.hass.loop.create_future()
+        waiters.append(waiter)
+        if self._task is None:
+            self._task = self.hass.async_create_background_task(
+                self._async_worker(), name=f"WordClock commands {self.name}"
+            )
+        return waiter
+
+    async def _async_worker(self) -> None:
+        """Send pending writes, waiting at least min_interval between requests."""
+        try:
+            while self.pending:
+                delay = self._last_sent + self.min_interval - time.monotonic()
+                if delay > 0:
+                    # Writes arriving meanwhile are merged into the pending ones.
+                    await asyncio.sleep(delay)
+
+                if self._config:
+                    target = CONFIG_TARGET
+                    params, waiters = self._config, self._config_waiters
+                    self._config, self._config_waiters = {}, []
+                    path = f"/config?{_query(params)}"
+                else:
+                    target = next(iter(self._words))
+                    params = self._words.pop(target)
+                    waiters = self._word_waiters.pop(target, [])
+                    path = f"/ew/?{_query(params)}"
+
+                # Only frames were merged into this request unless the target is changing.
+                frame = target not in self._changing
+                self._changing.discard(target)
+                if not frame:
+                    self._sending.add(target)
+                try:
+                    result = await self._send(path, target=target, frame=frame)
+                finally:
+                    self._sending.discard(target)
+                self._last_sent = time.monotonic()
+                for waiter in waiters:
+                    if not waiter.done():
+                        waiter.set_result(result)
+        finally:
+            if self._task is asyncio.current_task():
+                self._task = None
+
+
+def _query(params: Dict[str, int]) -> str:
+    """Build a query string the way the firmware expects it (no escaping needed)."""
+    return "&".join(f"{key}={value}" for key, value in params.items())
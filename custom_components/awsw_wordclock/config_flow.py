@@ -1,7 +1,26 @@
 """Config flow for AWSW WordClock integration."""
+import ipaddress
+
 from homeassistant import config_entries
+from homeassistant.components import network
+from homeassistant.core import callback
+from homeassistant.helpers.aiohttp_client import async_get_clientsession
+import homeassistant.helpers.config_validation as cv
 import voluptuous as vol
-from .const import DOMAIN
+from .client import WordClockClient, WordClockRequestError
+from .const import (
+    DISCOVERY_MAX_HOSTS,
+    DOMAIN,
+    DEFAULT_COLOR_POLLING_TIME,
+    DEFAULT_CONNECT_TIMEOUT,
+    DEFAULT_MAX_CONNECTIONS,
+    DEFAULT_MAX_POLLING_TIME,
+    DEFAULT_READ_TIMEOUT,
+    DEFAULT_RETRIES,
+    word_id_for,
+)
+from .discovery import async_scan
+from .protocol import ProtocolError, parse_status
 
 # Language mapping for configuration forms
 LANGUAGES = {
@@ -14,6 +33,9 @@ LANGUAGES = {
     "Spanish": "Español",
 }
 
+# Lights a group can span
+GROUP_TARGETS = ["time", "background", "word"]
+
 class WordClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
     """Handle a config flow for AWSW WordClock.
 
@@ -22,36 +44,57 @@ class WordClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
 
     VERSION = 1
 
+    def __init__(self):
+        """Initialize the flow."""
+        self._settings = {}
+        self._found = []
+
     async def async_step_user(self, user_input=None):
-        """Handle the initial step for configuring a new device.
+        """Handle the initial step.
+
+        Once clocks are configured, offer to add a clock or a group of clocks.
+        """
+        if user_input is None and self._clock_entries():
+            return self.async_show_menu(step_id="user", menu_options=["clock", "group"])
+        return await self.async_step_clock(user_input)
+
+    async def async_step_clock(self, user_input=None):
+        """Handle the step for configuring a new device.
 
-        Validates user input and creates configuration entry if valid.
+        Validates user input and creates configuration entry if valid. Without
+        an IP address, or with a network like 192.168.1.0/24, the network is
+        searched for clocks instead.
         """
         errors = {}
         if user_input is not None:
-            ip_address = user_input.get("ip_address")
-            name = user_input.get("name", f"WordClock ({ip_address})")
-            language = user_input.get("language")
-            polling_time = user_input.get("polling_time", 5)
+            ip_address = (user_input.get("ip_address") or "").strip()
+            self._settings = {
+                "name": user_input.get("name", "WordClock"),
+                "language": user_input.get("language"),
+                "polling_time": user_input.get("polling_time", 5),
+            }
 
+            if not ip_address or "/" in ip_address:
+                # Search the given network, or the local /24 if none was given.
+                error = await self._async_discover(ip_address)
+                if error is None:
+                    return await self.async_step_pick()
+                errors["base"] = error
             # Validate IP address and check for duplicates
-            if not self._is_valid_ip(ip_address):
+            elif not self._is_valid_ip(ip_address):
                 errors["base"] = "invalid_ip"
             elif await self._is_ip_already_configured(ip_address):
                 errors["base"] = "ip_exists"
+            elif not await self._async_probe(ip_address):
+                errors["base"] = "cannot_connect"
             else:
-                # Create configuration entry with validated data
-                return self.async_create_entry(
-                    title=name,
-                    data={"ip_address": ip_address, "name": name},
-                    options={"language": language, "polling_time": polling_time},
-                )
+                return self._async_create(ip_address, self._settings["name"] or f"WordClock ({ip_address})")
 
         # Show configuration form with validation schema
         return self.async_show_form(
-            step_id="user",
+            step_id="clock",
             data_schema=vol.Schema({
-                vol.Required("ip_address"): str,
+                vol.Optional("ip_address"): str,
                 vol.Optional("name", default="WordClock"): str,
                 vol.Required("language", default="German"): vol.In(LANGUAGES),
                 vol.Required("polling_time", default=5): vol.All(vol.Coerce(int), vol.Range(min=1)),
@@ -59,6 +102,108 @@ class WordClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
             errors=errors,
         )
 
+    async def async_step_pick(self, user_input=None):
+        """Let the user pick one of the discovered clocks."""
+        errors = {}
+        if user_input is not None:
+            ip_address = user_input["ip_address"]
+            if await self._is_ip_already_configured(ip_address):
+                errors["base"] = "ip_exists"
+            elif not await self._async_probe(ip_address):
+                errors["base"] = "cannot_connect"
+            else:
+                return self._async_create(ip_address, user_input.get("name") or f"WordClock ({ip_address})")
+
+        return self.async_show_form(
+            step_id="pick",
+            data_schema=vol.Schema({
+                vol.Required("ip_address"): vol.In(self._found),
+                vol.Optional("name", default=self._settings.get("name") or "WordClock"): str,
+            }),
+            errors=errors,
+        )
+
+    async def async_step_group(self, user_input=None):
+        """Configure a light that spans the same light of several clocks."""
+        clocks = {entry.entry_id: entry.title for entry in self._clock_entries()}
+        errors = {}
+        if user_input is not None:
+            members = [entry_id for entry_id in user_input.get("members", []) if entry_id in clocks]
+            word = (user_input.get("word") or "").strip()
+            if not members:
+                errors["base"] = "no_members"
+            elif user_input["target"] == "word" and not all(
+                word and word_id_for(self._clock_language(entry_id), word) is not None for entry_id in members
+            ):
+                errors["base"] = "word_missing"
+            else:
+                return self.async_create_entry(
+                    title=user_input["name"],
+                    data={
+                        "group": True,
+                        "name": user_input["name"],
+                        "target": user_input["target"],
+                        "word": word if user_input["target"] == "word" else None,
+                        "members": members,
+                    },
+                )
+
+        return self.async_show_form(
+            step_id="group",
+            data_schema=vol.Schema({
+                vol.Required("name", default="WordClock Group"): str,
+                vol.Required("target", default="time"): vol.In(GROUP_TARGETS),
+                vol.Optional("word"): str,
+                vol.Required("members"): cv.multi_select(clocks),
+            }),
+            errors=errors,
+        )
+
+    def _clock_entries(self):
+        """Return the configured clocks, leaving out groups."""
+        return [entry for entry in self._async_current_entries() if not entry.data.get("group")]
+
+    def _clock_language(self, entry_id):
+        """Return the configured language of a clock entry."""
+        entry = self.hass.config_entries.async_get_entry(entry_id)
+        return entry.options.get("language", entry.data.get("language", "German"))
+
+    def _async_create(self, ip_address, name):
+        """Create the configuration entry of a validated clock."""
+        return self.async_create_entry(
+            title=name,
+            data={"ip_address": ip_address, "name": name},
+            options={"language": self._settings["language"], "polling_time": self._settings["polling_time"]},
+        )
+
+    async def _async_discover(self, network_text):
+        """Scan a network for clocks that are not configured yet; return an error key or None."""
+        try:
+            if network_text:
+                scan_network = ipaddress.ip_network(network_text, strict=False)
+            else:
+                source_ip = await network.async_get_source_ip(self.hass)
+                scan_network = ipaddress.ip_network(f"{source_ip}/24", strict=False)
+        except ValueError:
+            return "invalid_network"
+        if scan_network.version != 4 or scan_network.num_addresses > DISCOVERY_MAX_HOSTS:
+            return "invalid_network"
+
+        configured = {entry.data.get("ip_address") for entry in self._async_current_entries()}
+        self._found = await async_scan(async_get_clientsession(self.hass), scan_network, exclude=configured)
+        return None if self._found else "no_devices_found"
+
+    async def _async_probe(self, ip_address):
+        """Return True if a WordClock answers a single /status request at the address."""
+        client = WordClockClient(ip_address, retries=0)
+        try:
+            parse_status(await client.async_get("/status"))
+            return True
+        except (WordClockRequestError, ProtocolError):
+            return False
+        finally:
+            await client.async_close()
+
     def _is_valid_ip(self, ip_address):
         """Validate the given IP address.
 
@@ -89,6 +234,12 @@ class WordClockConfigFlow(config_entries.ConfigFlow, domain=DOMAIN):
                 return True
         return False
 
+    @classmethod
+    @callback
+    def async_supports_options_flow(cls, config_entry):
+        """Return True for clocks; groups have nothing to tune."""
+        return not config_entry.data.get("group")
+
     @staticmethod
     def async_get_options_flow(config_entry):
         """Return the options flow for this handler.
@@ -115,6 +266,14 @@ class WordClockOptionsFlow(config_entries.OptionsFlow):
             "language", config_entry.data.get("language", "German")
         )
         self.current_polling_time = config_entry.options.get("polling_time", 5)
+        self.current_max_polling_time = config_entry.options.get("max_polling_time", DEFAULT_MAX_POLLING_TIME)
+        self.current_color_polling_time = config_entry.options.get("color_polling_time", DEFAULT_COLOR_POLLING_TIME)
+        self.current_max_connections = config_entry.options.get(
+            "max_connections", DEFAULT_MAX_CONNECTIONS
+        )
+        self.current_connect_timeout = config_entry.options.get("connect_timeout", DEFAULT_CONNECT_TIMEOUT)
+        self.current_read_timeout = config_entry.options.get("read_timeout", DEFAULT_READ_TIMEOUT)
+        self.current_retries = config_entry.options.get("retries", DEFAULT_RETRIES)
 
     async def async_step_init(self, user_input=None):
         """Handle the initial step of the options flow.
@@ -129,5 +288,11 @@ class WordClockOptionsFlow(config_entries.OptionsFlow):
             data_schema=vol.Schema({
                 vol.Required("language", default=self.current_language): vol.In(LANGUAGES),
                 vol.Required("polling_time", default=self.current_polling_time): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required("max_polling_time", default=self.current_max_polling_time): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required("color_polling_time", default=self.current_color_polling_time): vol.All(vol.Coerce(int), vol.Range(min=1)),
+                vol.Required("max_connections", default=self.current_max_connections): vol.All(vol.Coerce(int), vol.Range(min=1, max=4)),
+                vol.Required("connect_timeout", default=self.current_connect_timeout): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=30)),
+                vol.Required("read_timeout", default=self.current_read_timeout): vol.All(vol.Coerce(float), vol.Range(min=0.5, max=60)),
+                vol.Required("retries", default=self.current_retries): vol.All(vol.Coerce(int), vol.Range(min=0, max=5)),
             })
         )
\ No newline at end of file
@@ -1,3 +1,175 @@
-
 DOMAIN = "awsw_wordclock"
-    
\ No newline at end of file
+
+# Mapping of extra word light texts per language.
+LANGUAGE_WORDS = {
+    "German": {
+        1: "ALARM",
+        2: "GEBURTSTAG",
+        3: "MÜLL RAUS BRINGEN",
+        4: "AUTO",
+        5: "FEIERTAG",
+        6: "FORMEL1",
+        7: "GELBER SACK",
+        8: "URLAUB",
+        9: "WERKSTATT",
+        10: "ZEIT ZUM ZOCKEN",
+        11: "FRISEUR",
+        12: "TERMIN",
+    },
+    "English": {
+        1: "COME HERE",
+        2: "LUNCH TIME",
+        3: "ALARM",
+        4: "GARBAGE",
+        5: "HOLIDAY",
+        6: "TEMPERATURE",
+        7: "DATE",
+        8: "BIRTHDAY",
+        9: "DOORBELL",
+    },
+    "Dutch": {
+        1: "KOM HIER",
+        2: "LUNCH TIJD",
+        3: "ALARM",
+        4: "AFVAL",
+        5: "VAKANTIE",
+        6: "TEMPERATUUR",
+        7: "DATUM",
+        8: "VERJAARDAG",
+        9: "DEURBEL",
+    },
+    "French": {
+        1: "ALARME",
+        2: "ANNIVERSAIRE",
+        3: "POUBELLE",
+        4: "A TABLE",
+        5: "VACANCES",
+        6: "VIENS ICI",
+        7: "SONNETTE",
+        8: "TEMPERATURE",
+        9: "DATE",
+    },
+    "Italian": {
+        1: "VIENI QUI",
+        2: "ORA DI PRANZO",
+        3: "ALLARME",
+        4: "VACANZA",
+        5: "TEMPERATURA",
+        6: "DATA",
+        7: "COMPLEANNO",
+        8: "CAMPANELLO",
+    },
+    "Swedish": {
+        1: "FÖDELSEDAG",
+        2: "LARM",
+        3: "HÖGTID",
+        4: "SEMESTER",
+        5: "LADDA NER",
+        6: "LUNCHTID",
+        7: "KOM HIT",
+        8: "DÖRRKLOCKA",
+        9: "TEMPERATUR",
+    },
+    "Spanish": {
+        1: "CUMPLEAÑOS",
+        2: "ALARMA",
+        3: "VACACIONES",
+        4: "DÍA DE BASURA",
+        5: "FECHA",
+        6: "HORA DE ALMUERZO",
+        7: "VEN AQUÍ",
+        8: "TIMBRE",
+        9: "TEMPERATURA",
+    },
+}
+
+
+def words_for_language(language: str) -> dict:
+    """Return the extra words of a language, falling back to German."""
+    return LANGUAGE_WORDS.get(language) or LANGUAGE_WORDS["German"]
+
+
+def word_id_for(language: str, word: str):
+    """Return the id of a word (matched case-insensitively) in a language, or None."""
+    for word_id, name in words_for_language(language).items():
+        if name.casefold() == word.casefold():
+            return word_id
+    return None
+
+
+# Minimum delay in seconds between two writes to the same device.
+DEFAULT_COMMAND_INTERVAL = 0.2
+
+# Number of simultaneous requests a single clock is given; the word polls
+# of a pass also run at most this many at a time.
+DEFAULT_MAX_CONNECTIONS = 1
+
+# HTTP client defaults: timeouts in seconds and retries per request.
+DEFAULT_CONNECT_TIMEOUT = 3.0
+DEFAULT_READ_TIMEOUT = 5.0
+DEFAULT_RETRIES = 1
+
+# Adaptive polling: upper bound of the interval in seconds, the factor it
+# grows by per unchanged pass, and how long to poll fast after activity.
+DEFAULT_MAX_POLLING_TIME = 60
+IDLE_POLL_FACTOR = 1.5
+FAST_POLL_WINDOW = 30
+
+# Refresh tiers: the word colors (/ewrgb) rarely change unless this
+# integration changes them, so they are re-read only every this many seconds.
+DEFAULT_COLOR_POLLING_TIME = 300
+
+# Seconds after a write was sent before the written endpoint is read back.
+VERIFY_DELAY = 0.5
+
+# Transitions and effects: frames are at least this many seconds apart and
+# at least this many device round trips; effects repeat every EFFECT_PERIOD
+# seconds and pulse down to PULSE_MIN_LEVEL of the word's color.
+MIN_FRAME_INTERVAL = 0.1
+FRAME_RTT_FACTOR = 2
+EFFECT_PERIOD = 2.0
+PULSE_MIN_LEVEL = 0.2
+
+# Storage of the last known state of all clocks, saved at most every
+# STATE_SAVE_DELAY seconds.
+STORAGE_KEY = "awsw_wordclock.state"
+STORAGE_VERSION = 1
+STATE_SAVE_DELAY = 30
+
+# Number of traces the profile service keeps (oldest are dropped first).
+TRACE_BUFFER_SIZE = 5000
+
+# Number of recent requests and poll cycles the latency percentiles cover.
+TELEMETRY_WINDOW = 500
+
+# Network discovery in the config flow: probes in flight, seconds per probe,
+# and the largest network (in addresses) that may be scanned.
+DISCOVERY_CONCURRENCY = 64
+DISCOVERY_TIMEOUT = 1.0
+DISCOVERY_MAX_HOSTS = 1024
+
+# Seconds platform setup waits for the first /status read before adding
+# entities without state; the refresh itself continues in the background.
+FIRST_REFRESH_TIMEOUT = 3
+
+# Consecutive failed requests after which a device is marked unavailable.
+DEFAULT_FAILURE_THRESHOLD = 3
+
+# Keys of the integration-wide entity indexes in hass.data[DOMAIN].
+DATA_ENTITY_INDEX = "entity_index"
+DATA_WORD_INDEX = "word_index"
+# Named clock snapshots of the snapshot/restore services in hass.data[DOMAIN].
+DATA_SNAPSHOTS = "snapshots"
+# Fleet scheduler in hass.data[DOMAIN].
+DATA_FLEET = "fleet"
+# The running profile session, if any, in hass.data[DOMAIN].
+DATA_TRACER = "tracer"
+# Dispatcher signal sent when a clock entry was set up or unloaded.
+SIGNAL_CLOCKS_CHANGED = "awsw_wordclock_clocks_changed"
+# Persisted last known state of all clocks in hass.data[DOMAIN].
+DATA_STORE = "store"
+
+# Requests in flight across all clocks, and the random jitter in seconds
+# added to every staggered poll.
+DEFAULT_FLEET_MAX_IN_FLIGHT = 8
+FLEET_JITTER = 0.25
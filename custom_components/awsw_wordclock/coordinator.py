@@ -0,0 +1,700 @@
+"""Device coordinator for the AWSW WordClock integration."""
+import asyncio
+import logging
+import time
+from typing import Callable, Dict, Iterable, NamedTuple, Optional, Tuple
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.event import async_call_later
+
+from .breaker import CircuitBreaker
+from .client import WordClockClient, WordClockRequestError
+from .commands import CONFIG_TARGET, CommandQueue
+from .const import (
+    DEFAULT_COLOR_POLLING_TIME,
+    DEFAULT_MAX_POLLING_TIME,
+    FAST_POLL_WINDOW,
+    FIRST_REFRESH_TIMEOUT,
+    IDLE_POLL_FACTOR,
+    VERIFY_DELAY,
+)
+from .effects import EffectEngine
+from .fleet import FleetScheduler
+from .protocol import (
+    ProtocolError,
+    StatusSnapshot,
+    WordSnapshot,
+    parse_ewrgb,
+    parse_ewstatus,
+    parse_status,
+)
+from .scheduler import (
+    PRIORITY_COMMAND,
+    PRIORITY_POLL,
+    PRIORITY_VERIFY,
+    RequestDropped,
+    RequestScheduler,
+)
+from .telemetry import DeviceTelemetry
+from .tracing import Tracer
+
+LOGGER = logging.getLogger(__name__)
+
+# Verification target of /config writes; words are verified by their id.
+_VERIFY_STATUS = CONFIG_TARGET
+
+
+class ClockSnapshot(NamedTuple):
+    """Full state of a clock as captured by the snapshot service."""
+
+    status: Optional[StatusSnapshot]
+    words: Dict[int, WordSnapshot]
+
+
+def _apply_config(status: StatusSnapshot, params: Dict[str, int]) -> StatusSnapshot:
+    """Return the status after the device applied the given /config parameters."""
+    return StatusSnapshot(
+        tuple(params.get(f"{c}-Time", v) for c, v in zip("RGB", status.time_rgb)),
+        tuple(params.get(f"{c}-Back", v) for c, v in zip("RGB", status.back_rgb)),
+        params.get("INTENSITY", status.intensity),
+    )
+
+
+class WordClockCoordinator:
+    """Fetch device-wide state once per cycle and fan it out to the entities.
+
+    The Time and Background lights both read from /status. Instead of each
+    entity requesting it on its own, the coordinator fetches and parses it once
+    and notifies every registered listener with the shared snapshot. The extra
+    words are refreshed the same way: one pass over all words with a bounded
+    number of requests in flight, published as a single snapshot.
+
+    The coordinator is the only scheduler that talks to the device; entities do
+    not poll and only receive pushed snapshots. Writes go through its command
+    queue, which coalesces bursts of changes for the same target. Every request
+    takes a slot from the priority scheduler, so commands preempt polls.
+
+    Refreshes are tiered: /status and the word states are read on every pass,
+    the word colors only every color_polling_time seconds. Writing a word
+    color invalidates that word's color so the next pass reads it back.
+
+    Every write is checked once it was sent: after VERIFY_DELAY seconds only
+    the written endpoint is read back at verification priority, and the
+    cached state is corrected if the device disagrees with it.
+
+    The refresh interval adapts to the device: it starts at polling_time,
+    stretches towards max_polling_time while nothing changes, snaps back to
+    polling_time for FAST_POLL_WINDOW seconds after a command or a detected
+    change, and backs off exponentially while the device is unreachable.
+    After repeated failures the circuit breaker opens: the entities become
+    unavailable and only /status is probed every max_polling_time seconds.
+    With a fleet scheduler, refreshes are moved onto this clock's phase slot
+    and requests count against the fleet-wide in-flight cap.
+    """
+
+    def __init__(
+        self,
+        hass: HomeAssistant,
+        client: WordClockClient,
+        color_polling_time: int = DEFAULT_COLOR_POLLING_TIME,
+        fleet: Optional[FleetScheduler] = None,
+        fleet_key: Optional[str] = None,
+    ) -> None:
+        """Initialize the coordinator."""
+        self.hass = hass
+        self.client = client
+        self.fleet = fleet
+        self.fleet_key = fleet_key
+        self.ip_address = client.host
+        self.color_polling_time = color_polling_time
+        self._listeners: list[Callable[[], None]] = []
+        self._status_lock = asyncio.Lock()
+        self._words_lock = asyncio.Lock()
+        self.status: Optional[StatusSnapshot] = None
+        self.word_ids: list[int] = []
+        self.words: Dict[int, WordSnapshot] = {}
+        # Monotonic time at which each word's color is due to be read again.
+        self._color_due: Dict[int, float] = {}
+        self.polling_time: Optional[int] = None
+        self.max_polling_time: int = DEFAULT_MAX_POLLING_TIME
+        self.interval: Optional[float] = None
+        self.last_update_success = True
+        self._failures = 0
+        self._fast_until = 0.0
+        self._next_refresh = 0.0
+        self._running = False
+        self._unsub_refresh: Optional[Callable[[], None]] = None
+        # The scheduled refresh pass while it runs, cancelled on shutdown.
+        self._refresh_task: Optional[asyncio.Task] = None
+        self._first_refresh: Optional[asyncio.Task] = None
+        # Set once the first /status read succeeded or failed.
+        self._status_attempted = asyncio.Event()
+        # Entities of this device, registered by the platforms during setup.
+        self.entities: list = []
+        self.scheduler = RequestScheduler(client.max_connections)
+        self.breaker = CircuitBreaker(self.ip_address)
+        # Entity state writes skipped because nothing changed.
+        self.suppressed_writes = 0
+        # Pending read-after-write checks per target, and how many corrected the cache.
+        self._unsub_verify: Dict[object, Callable[[], None]] = {}
+        self.verify_corrections = 0
+        self.commands = CommandQueue(hass, self.ip_address, self.async_send_request)
+        self.telemetry = DeviceTelemetry()
+        # Set by the profile service while it runs; None keeps tracing off.
+        self.tracer: Optional[Tracer] = None
+        # Smoothed round-trip time of the device in seconds, paces the animations.
+        self.rtt = 0.0
+        self.effects = EffectEngine(self)
+
+    @property
+    def available(self) -> bool:
+        """Return False while the circuit breaker is open."""
+        return not self.breaker.is_open
+
+    @callback
+    def async_set_words(self, word_ids: Iterable[int]) -> None:
+        """Set the extra words that are refreshed on every pass."""
+        self.word_ids = sorted(word_ids)
+        self.words = {word_id: word for word_id, word in self.words.items() if word_id in self.word_ids}
+        self._color_due = {word_id: due for word_id, due in self._color_due.items() if word_id in self.word_ids}
+
+    @callback
+    def async_invalidate_colors(self, word_id: Optional[int] = None) -> None:
+        """Read the color of a word (or of all words) again on the next pass."""
+        if word_id is None:
+            self._color_due.clear()
+        else:
+            self._color_due.pop(word_id, None)
+
+    @callback
+    def async_set_word_polled(self, word_id: int, polled: bool) -> None:
+        """Add a word to or drop it from the refresh passes.
+
+        The word lights call this when they are added to or removed from Home
+        Assistant, so words whose light is disabled are not polled.
+        """
+        if polled and word_id not in self.word_ids:
+            self.async_set_words([*self.word_ids, word_id])
+        elif not polled and word_id in self.word_ids:
+            self.async_set_words([other for other in self.word_ids if other != word_id])
+        else:
+            return
+        LOGGER.debug("Polling %d extra words of WordClock %s", len(self.word_ids), self.ip_address)
+
+    @callback
+    def async_register_entities(self, entities: Iterable) -> None:
+        """Record the entities a platform created for this device."""
+        self.entities.extend(entities)
+
+    @callback
+    def async_unregister_entities(self, entities: Iterable) -> None:
+        """Forget entities that were removed from this device."""
+        entities = list(entities)
+        self.entities = [entity for entity in self.entities if entity not in entities]
+
+    @callback
+    def async_start_first_refresh(self) -> None:
+        """Start the first refresh in the background while the platforms set up."""
+        self._first_refresh = self.hass.async_create_background_task(
+            self.async_refresh(), f"WordClock {self.ip_address} first refresh"
+        )
+
+    async def async_wait_first_refresh(self) -> None:
+        """Wait up to FIRST_REFRESH_TIMEOUT seconds for the first /status read.
+
+        Returns right away if the state is already known, e.g. from storage,
+        and as soon as the read failed, so an offline clock does not hold up
+        startup. The words of the first refresh arrive through the listeners.
+        """
+        if self._first_refresh is None or self.status is not None:
+            return
+        try:
+            await asyncio.wait_for(self._status_attempted.wait(), FIRST_REFRESH_TIMEOUT)
+        except asyncio.TimeoutError:
+            LOGGER.debug("First status of WordClock %s did not arrive within %s seconds",
+                         self.ip_address, FIRST_REFRESH_TIMEOUT)
+
+    @callback
+    def async_set_cache(self, status: Optional[StatusSnapshot], words: Dict[int, WordSnapshot]) -> None:
+        """Seed the cached state, e.g. with the state stored before a restart."""
+        self.status = status
+        self.words = {word_id: word for word_id, word in words.items() if word_id in self.word_ids}
+
+    @callback
+    def async_add_listener(self, update_callback: Callable[[], None]) -> Callable[[], None]:
+        """Register a callback for new snapshots; return a function that removes it."""
+        self._listeners.append(update_callback)
+
+        @callback
+        def remove_listener() -> None:
+            if update_callback in self._listeners:
+                self._listeners.remove(update_callback)
+
+        return remove_listener
+
+    @callback
+    def async_update_listeners(self) -> None:
+        """Notify all registered listeners about the current snapshot."""
+        tracer = self.tracer
+        if tracer is not None:
+            started = time.monotonic()
+        for update_callback in list(self._listeners):
+            update_callback()
+        if tracer is not None:
+            elapsed = time.monotonic() - started
+            tracer.note("state_write", elapsed)
+            tracer.record_event("publish", self.ip_address, elapsed, listeners=len(self._listeners))
+
+    async def async_refresh_status(self) -> None:
+        """Fetch /status once and publish the parsed snapshot to all listeners."""
+        # Concurrent callers share one request instead of issuing their own.
+        if self._status_lock.locked():
+            async with self._status_lock:
+                return
+        async with self._status_lock:
+            generation = self.commands.generation(CONFIG_TARGET)
+            try:
+                # /status doubles as the probe while the breaker is open.
+                text = await self._async_fetch_text("/status", target=CONFIG_TARGET, probe=True)
+            except RequestDropped:
+                return
+            finally:
+                self._status_attempted.set()
+            # /status is the reachability signal for the adaptive interval.
+            self.last_update_success = text is not None
+            if text is None or self._is_stale(CONFIG_TARGET, generation) or self._config_animating():
+                return
+            try:
+                self.status = self._parse(parse_status, text)
+            except ProtocolError as e:
+                LOGGER.error("Error updating WordClock status: %s", e)
+                return
+        self.async_update_listeners()
+
+    @callback
+    def async_start(self, polling_time: int, max_polling_time: int = DEFAULT_MAX_POLLING_TIME) -> None:
+        """Start (or restart) the adaptive refresh with the given intervals in seconds."""
+        self.async_stop()
+        self.polling_time = polling_time
+        self.max_polling_time = max(polling_time, max_polling_time)
+        self.interval = polling_time
+        self._failures = 0
+        self._running = True
+        LOGGER.info("Setting up polling for WordClock %s with interval of %s to %s seconds",
+                    self.ip_address, polling_time, self.max_polling_time)
+        self._async_schedule_refresh(polling_time)
+
+    @callback
+    def async_stop(self) -> None:
+        """Cancel the periodic refresh, if running."""
+        self._running = False
+        if self._unsub_refresh is not None:
+            LOGGER.debug("Cancelling polling task for WordClock %s", self.ip_address)
+            self._unsub_refresh()
+            self._unsub_refresh = None
+
+    @callback
+    def async_note_activity(self) -> None:
+        """Poll at the fast interval for a while, e.g. after a command."""
+        self._fast_until = time.monotonic() + FAST_POLL_WINDOW
+        if not self._running or self._unsub_refresh is None:
+            return
+        self.interval = self.polling_time
+        # Pull the next refresh forward if it is further away than the fast interval.
+        if self._next_refresh - time.monotonic() > self.polling_time:
+            self._async_schedule_refresh(self.polling_time)
+
+    @callback
+    def _async_schedule_refresh(self, delay: float) -> None:
+        """Schedule the next refresh pass in delay seconds."""
+        if self._unsub_refresh is not None:
+            self._unsub_refresh()
+        if self.fleet is not None:
+            delay = self.fleet.align(self.fleet_key, delay)
+        self._next_refresh = time.monotonic() + delay
+        self._unsub_refresh = async_call_later(self.hass, delay, self._async_scheduled_refresh)
+
+    def _next_interval(self, changed: bool) -> float:
+        """Return the delay before the next refresh pass."""
+        if self.breaker.is_open:
+            # Only a single low-rate probe while the device is unreachable.
+            return self.max_polling_time
+        if not self.last_update_success:
+            # Exponential backoff while the device is unreachable.
+            self._failures += 1
+            return min(self.max_polling_time, self.polling_time * 2 ** self._failures)
+        self._failures = 0
+        if changed:
+            self._fast_until = time.monotonic() + FAST_POLL_WINDOW
+        if time.monotonic() < self._fast_until:
+            return self.polling_time
+        # Nothing happened recently; stretch the interval towards the maximum.
+        return min(self.max_polling_time, self.interval * IDLE_POLL_FACTOR)
+
+    async def async_shutdown(self) -> None:
+        """Stop polling, drop pending writes and close the HTTP client."""
+        self.async_stop()
+        if self._first_refresh is not None:
+            self._first_refresh.cancel()
+        if self._refresh_task is not None:
+            self._refresh_task.cancel()
+        self.effects.async_stop_all()
+        for unsub in self._unsub_verify.values():
+            unsub()
+        self._unsub_verify.clear()
+        self.commands.async_cancel()
+        self.entities.clear()
+        await self.client.async_close()
+
+    async def async_send_request(
+        self, path: str, priority: int = PRIORITY_COMMAND, target=None, frame: bool = False
+    ) -> bool:
+        """Send an HTTP GET request to the device; log any errors.
+
+        A command drops the queued polls of the target it writes. Animation
+        frames neither drop polls nor speed up polling.
+        """
+        if self.breaker.is_open:
+            LOGGER.debug("WordClock %s is unavailable, not sending %s", self.ip_address, path)
+            return False
+        if priority == PRIORITY_COMMAND and not frame:
+            self.async_note_activity()
+        tracer = self.tracer
+        if tracer is not None:
+            trace = tracer.start_request(self.ip_address, path, priority)
+            queued = time.monotonic()
+        try:
+            async with self.scheduler.slot(priority, None if frame else target):
+                if tracer is not None:
+                    trace["queue_wait"] = time.monotonic() - queued
+                LOGGER.debug("Sending request to %s: %s", self.ip_address, path)
+                await self._async_get(path, priority)
+        except RequestDropped:
+            return False
+        except WordClockRequestError as e:
+            self._async_record_failure(e)
+            return False
+        finally:
+            if tracer is not None:
+                trace["ok"] = trace["network"] is not None
+        self._async_record_success()
+        return True
+
+    async def _async_fetch_text(
+        self, path: str, priority: int = PRIORITY_POLL, target=None, probe: bool = False
+    ) -> Optional[str]:
+        """Read a device endpoint; return None on errors.
+
+        Raises RequestDropped when the scheduler discards a stale poll, or when
+        the breaker is open and the request is not the probe.
+        """
+        if self.breaker.is_open and not probe:
+            raise RequestDropped()
+        tracer = self.tracer
+        if tracer is not None:
+            trace = tracer.start_request(self.ip_address, path, priority)
+            queued = time.monotonic()
+        async with self.scheduler.slot(priority, target):
+            if tracer is not None:
+                trace["queue_wait"] = time.monotonic() - queued
+            try:
+                text = await self._async_get(path, priority)
+            except WordClockRequestError as e:
+                self._async_record_failure(e)
+                if tracer is not None:
+                    trace["ok"] = False
+                return None
+        if tracer is not None:
+            trace["ok"] = True
+        self._async_record_success()
+        return text
+
+    async def _async_get(self, path: str, priority: int) -> str:
+        """GET a path through the client, holding a fleet-wide slot if configured."""
+        if self.fleet is None:
+            return await self._async_timed_get(path)
+        async with self.fleet.slot(priority):
+            return await self._async_timed_get(path)
+
+    async def _async_timed_get(self, path: str) -> str:
+        """GET a path, record it and fold its duration into the smoothed round-trip time."""
+        started = time.monotonic()
+        try:
+            text = await self.client.async_get(path)
+        except WordClockRequestError:
+            self.telemetry.record_request(path, time.monotonic() - started, False)
+            raise
+        elapsed = time.monotonic() - started
+        self.telemetry.record_request(path, elapsed, True)
+        if self.tracer is not None:
+            self.tracer.note("network", elapsed)
+        self.rtt = elapsed if not self.rtt else 0.8 * self.rtt + 0.2 * elapsed
+        return text
+
+    def _parse(self, parser: Callable[[str], object], text: str):
+        """Parse a reply; time it while tracing."""
+        tracer = self.tracer
+        if tracer is None:
+            return parser(text)
+        started = time.monotonic()
+        try:
+            return parser(text)
+        finally:
+            tracer.note("parse", time.monotonic() - started)
+
+    @callback
+    def _async_record_success(self) -> None:
+        """Close the breaker on success and tell the entities they are available."""
+        if self.breaker.record_success():
+            self.async_update_listeners()
+
+    @callback
+    def _async_record_failure(self, error: Exception) -> None:
+        """Count a failure and mark the entities unavailable once the breaker opens."""
+        if self.breaker.record_failure(error):
+            self.async_update_listeners()
+
+    @callback
+    def async_write_config(self, params: Dict[str, int]) -> asyncio.Future:
+        """Queue a /config write and apply it to the cached status right away."""
+        future = self.commands.async_send_config(params)
+        self._async_verify_when_sent(future, _VERIFY_STATUS)
+        self.async_apply_config(params)
+        return future
+
+    @callback
+    def async_apply_config(self, params: Dict[str, int]) -> None:
+        """Apply /config parameters to the cached status without sending them."""
+        if self.status is not None:
+            self.status = _apply_config(self.status, params)
+            self.async_update_listeners()
+
+    @callback
+    def async_write_word(self, word_id: int, params: Dict[str, int]) -> asyncio.Future:
+        """Queue a /ew/ write and apply it to the cached word right away."""
+        future = self.commands.async_send_word(word_id, params)
+        self._async_verify_when_sent(future, word_id)
+        if "R" in params:
+            self.async_invalidate_colors(word_id)
+        self.async_apply_word(word_id, params)
+        return future
+
+    @callback
+    def async_apply_word(self, word_id: int, params: Dict[str, int]) -> None:
+        """Apply /ew/ parameters to the cached word without sending them."""
+        word = self.words.get(word_id)
+        if word is not None:
+            rgb = (params["R"], params["G"], params["B"]) if "R" in params else word.rgb
+            self.words = {**self.words, word_id: WordSnapshot(params[f"ew{word_id}"] == 1, rgb)}
+            self.async_update_listeners()
+
+    @callback
+    def _async_verify_when_sent(self, future: asyncio.Future, target) -> None:
+        """Read a target back once the write carrying it was sent successfully."""
+
+        def sent(done: asyncio.Future) -> None:
+            if not done.cancelled() and done.result():
+                self._async_schedule_verify(target)
+
+        future.add_done_callback(sent)
+
+    @callback
+    def _async_schedule_verify(self, target, retry: bool = False) -> None:
+        """Verify a target in VERIFY_DELAY seconds, replacing a pending check of it."""
+        unsub = self._unsub_verify.pop(target, None)
+        if unsub is not None:
+            unsub()
+
+        async def verify(now) -> None:
+            self._unsub_verify.pop(target, None)
+            await self._async_verify(target, retry)
+
+        self._unsub_verify[target] = async_call_later(self.hass, VERIFY_DELAY, verify)
+
+    async def _async_verify(self, target, retry: bool = False) -> None:
+        """Read back the endpoint of a written target and correct the cache.
+
+        A check that overlaps another write to the target is retried once;
+        after that the next regular poll reconciles the target.
+        """
+        generation = self.commands.generation(target)
+        try:
+            if target == _VERIFY_STATUS:
+                text = await self._async_fetch_text("/status", PRIORITY_VERIFY, CONFIG_TARGET)
+                actual = self._parse(parse_status, text) if text is not None else None
+                cached = self.status
+            elif target in self.word_ids:
+                actual = await self._async_fetch_word(target, PRIORITY_VERIFY)
+                cached = self.words.get(target)
+            else:
+                return
+        except RequestDropped:
+            return
+        except ProtocolError as e:
+            LOGGER.error("Error verifying WordClock %s: %s", self.ip_address, e)
+            return
+        if self._config_animating() if target == _VERIFY_STATUS else self.effects.animating(target):
+            # The animation ends with a write that is verified on its own.
+            return
+        if self._is_stale(target, generation):
+            # Another write went out meanwhile; check again once it settled.
+            if not retry:
+                self._async_schedule_verify(target, retry=True)
+            return
+        if actual is None or actual == cached:
+            return
+        LOGGER.debug("WordClock %s reports %s for %s after a write, expected %s",
+                     self.ip_address, actual, target, cached)
+        self.verify_corrections += 1
+        if target == _VERIFY_STATUS:
+            self.status = actual
+        else:
+            self.words = {**self.words, target: actual}
+        self.async_update_listeners()
+
+    @callback
+    def async_snapshot(self) -> ClockSnapshot:
+        """Return the cached state of the whole clock."""
+        return ClockSnapshot(self.status, dict(self.words))
+
+    async def async_restore(self, snapshot: ClockSnapshot) -> int:
+        """Write back a snapshot, sending only what differs from the cached state.
+
+        Time, Back and INTENSITY go out as one /config request and every changed
+        word as one /ew/ request. Animations of the restored targets are
+        stopped first; an animated target is written in full, since the device
+        may show a frame instead of the cached value. Returns the number of
+        requests queued.
+        """
+        writes = []
+        if snapshot.status is not None:
+            animated = self._config_animating()
+            self.effects.async_stop("Time")
+            self.effects.async_stop("Back")
+            current = None if animated else self.status
+            if snapshot.status != current:
+                params = {}
+                for prefix, saved_rgb, current_rgb in (
+                    ("Time", snapshot.status.time_rgb, current.time_rgb if current else None),
+                    ("Back", snapshot.status.back_rgb, current.back_rgb if current else None),
+                ):
+                    if saved_rgb != current_rgb:
+                        params.update(zip((f"R-{prefix}", f"G-{prefix}", f"B-{prefix}"), saved_rgb))
+                if current is None or snapshot.status.intensity != current.intensity:
+                    params["INTENSITY"] = snapshot.status.intensity
+                    params["INTENSITYviaWEB"] = 1
+                writes.append(self.async_write_config(params))
+
+        for word_id, saved in snapshot.words.items():
+            if word_id not in self.word_ids:
+                continue
+            animated = self.effects.animating(word_id)
+            self.effects.async_stop(word_id)
+            current = None if animated else self.words.get(word_id)
+            if saved == current:
+                continue
+            params = {f"ew{word_id}": int(saved.state)}
+            if current is None or saved.rgb != current.rgb:
+                params.update(zip("RGB", saved.rgb))
+            writes.append(self.async_write_word(word_id, params))
+
+        LOGGER.debug("Restoring WordClock %s with %d requests", self.ip_address, len(writes))
+        await asyncio.gather(*writes)
+        return len(writes)
+
+    def _config_animating(self) -> bool:
+        """Return True while the Time or Background color is being animated."""
+        return self.effects.animating("Time") or self.effects.animating("Back")
+
+    def _is_stale(self, target, generation: int) -> bool:
+        """Return True if a write to target is under way or was queued since a read started."""
+        return self.commands.busy_with(target) or self.commands.generation(target) != generation
+
+    async def _async_scheduled_refresh(self, now) -> None:
+        """Run one scheduled refresh pass and schedule the next one."""
+        self._unsub_refresh = None
+        self._refresh_task = asyncio.current_task()
+        LOGGER.debug("Polling WordClock %s using interval: %s seconds", self.ip_address, self.interval)
+        if self.fleet is not None:
+            self.fleet.note_poll()
+        previous = (self.status, self.words)
+        try:
+            await self.async_refresh()
+        finally:
+            self._refresh_task = None
+            # A command may have scheduled a pass while this one was running.
+            if self._running and self._unsub_refresh is None:
+                self.interval = self._next_interval((self.status, self.words) != previous)
+                self._async_schedule_refresh(self.interval)
+
+    async def async_refresh(self) -> None:
+        """Refresh the status and all extra words in one pass."""
+        started = time.monotonic()
+        await asyncio.gather(self.async_refresh_status(), self.async_refresh_words())
+        elapsed = time.monotonic() - started
+        self.telemetry.record_cycle(elapsed)
+        if self.tracer is not None:
+            self.tracer.record_event("cycle", self.ip_address, elapsed)
+        LOGGER.debug("Request scheduler stats for WordClock %s: %s, suppressed state writes: %d",
+                     self.ip_address, self.scheduler.stats, self.suppressed_writes)
+        if self.fleet is not None:
+            LOGGER.debug("WordClock fleet poll spread: %s", self.fleet.stats)
+
+    async def async_refresh_words(self) -> None:
+        """Fetch the state and color of every extra word and publish one snapshot."""
+        if self._words_lock.locked():
+            async with self._words_lock:
+                return
+        async with self._words_lock:
+            # More word polls than the connection budget would only wait in the scheduler.
+            semaphore = asyncio.Semaphore(max(1, self.scheduler.max_connections))
+
+            async def fetch(word_id: int) -> Tuple[int, Optional[WordSnapshot]]:
+                async with semaphore:
+                    return word_id, await self._async_fetch_word(word_id)
+
+            generations = {word_id: self.commands.generation(word_id) for word_id in self.word_ids}
+            results = await asyncio.gather(*(fetch(word_id) for word_id in self.word_ids))
+            words = dict(self.words)
+            for word_id, word in results:
+                # Skip words that stopped being polled during the pass, and
+                # words being written or animated: publishing them would revert
+                # the optimistic state of their entities.
+                if (word is not None and word_id in self.word_ids
+                        and not self._is_stale(word_id, generations[word_id])
+                        and not self.effects.animating(word_id)):
+                    words[word_id] = word
+            self.words = words
+        self.async_update_listeners()
+
+    async def _async_fetch_word(self, word_id: int, priority: int = PRIORITY_POLL) -> Optional[WordSnapshot]:
+        """Fetch /ewstatus and, when due, /ewrgb for one word; keep the last value on errors."""
+        previous = self.words.get(word_id)
+        state = previous.state if previous else False
+        rgb = previous.rgb if previous else (255, 255, 255)
+        changed = False
+
+        try:
+            data = await self._async_fetch_text(f"/ewstatus/?{word_id}", priority, word_id)
+            if data is not None:
+                try:
+                    state = self._parse(parse_ewstatus, data)
+                    changed = True
+                except ProtocolError as e:
+                    LOGGER.error("Unexpected response format for extra word %s: %s", word_id, e)
+
+            # The color is in the slow tier; read it only when due or unknown.
+            if previous is not None and time.monotonic() < self._color_due.get(word_id, 0):
+                return WordSnapshot(state=state, rgb=rgb) if changed else None
+            rgb_text = await self._async_fetch_text(f"/ewrgb/?{word_id}", priority, word_id)
+            if rgb_text is not None:
+                try:
+                    rgb = self._parse(parse_ewrgb, rgb_text)
+                    changed = True
+                    self._color_due[word_id] = time.monotonic() + self.color_polling_time
+                except ProtocolError as e:
+                    LOGGER.error("Unexpected RGB response format for extra word %s: %s", word_id, e)
+        except RequestDropped:
+            return None
+
+        return WordSnapshot(state=state, rgb=rgb) if changed else None
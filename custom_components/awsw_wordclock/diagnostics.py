@@ -0,0 +1,50 @@
+"""Diagnostics support for the AWSW WordClock integration."""
+from homeassistant.components.diagnostics import REDACTED, async_redact_data
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.core import HomeAssistant
+
+from .const import DATA_FLEET, DOMAIN
+
+TO_REDACT = {"ip_address"}
+
+
+def _redact_host(text, host: str):
+    """Return an error message with the clock's address redacted, e.g. from a request URL."""
+    return None if text is None else text.replace(host, REDACTED)
+
+
+async def async_get_config_entry_diagnostics(hass: HomeAssistant, entry: ConfigEntry) -> dict:
+    """Return the configuration and performance figures of a WordClock."""
+    if entry.data.get("group"):
+        return {"entry": {"data": dict(entry.data), "options": dict(entry.options)}}
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+    return {
+        "entry": {
+            "data": async_redact_data(dict(entry.data), TO_REDACT),
+            "options": dict(entry.options),
+        },
+        "available": coordinator.available,
+        "breaker": {
+            "open": coordinator.breaker.is_open,
+            "failures": coordinator.breaker.failures,
+            "last_error": _redact_host(coordinator.breaker.last_error, coordinator.ip_address),
+        },
+        "polling": {
+            "interval": coordinator.interval,
+            "polling_time": coordinator.polling_time,
+            "max_polling_time": coordinator.max_polling_time,
+            "color_polling_time": coordinator.color_polling_time,
+            "words": coordinator.word_ids,
+        },
+        "telemetry": coordinator.telemetry.as_dict(),
+        "round_trip_seconds": round(coordinator.rtt, 4),
+        "writes": {
+            "coalesced": coordinator.commands.coalesced,
+            "suppressed_state_writes": coordinator.suppressed_writes,
+            "verify_corrections": coordinator.verify_corrections,
+            "animation_frames": coordinator.effects.frames,
+            "dropped_animation_frames": coordinator.effects.dropped_frames,
+        },
+        "scheduler": coordinator.scheduler.stats,
+        "fleet": hass.data[DOMAIN][DATA_FLEET].stats,
+    }
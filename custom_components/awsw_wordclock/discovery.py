@@ -0,0 +1,51 @@
+"""Network discovery of AWSW WordClocks."""
+import asyncio
+import ipaddress
+import logging
+import time
+from typing import Iterable, List
+
+import aiohttp
+
+from .const import DISCOVERY_CONCURRENCY, DISCOVERY_TIMEOUT
+from .protocol import ProtocolError, parse_status
+
+LOGGER = logging.getLogger(__name__)
+
+
+async def async_scan(
+    session: aiohttp.ClientSession,
+    network: ipaddress.IPv4Network,
+    exclude: Iterable[str] = (),
+    port: int = 2023,
+    concurrency: int = DISCOVERY_CONCURRENCY,
+    timeout: float = DISCOVERY_TIMEOUT,
+) -> List[str]:
+    """Return the addresses in network that answer /status like a WordClock.
+
+    Hosts in exclude are skipped. At most concurrency probes run at a time,
+    each bounded by timeout seconds, so a /24 takes about
+    254 / concurrency * timeout seconds when nothing answers.
+    """
+    exclude = set(exclude)
+    semaphore = asyncio.Semaphore(concurrency)
+    client_timeout = aiohttp.ClientTimeout(total=timeout)
+
+    async def probe(host: str) -> bool:
+        async with semaphore:
+            try:
+                async with session.get(f"http://{host}:{port}/status", timeout=client_timeout) as response:
+                    if response.status != 200:
+                        return False
+                    parse_status(await response.text())
+            except (aiohttp.ClientError, asyncio.TimeoutError, ProtocolError, UnicodeDecodeError):
+                return False
+            return True
+
+    started = time.monotonic()
+    hosts = [str(host) for host in network.hosts() if str(host) not in exclude]
+    results = await asyncio.gather(*(probe(host) for host in hosts))
+    found = [host for host, is_clock in zip(hosts, results) if is_clock]
+    LOGGER.debug("Scanned %d hosts of %s in %.1f seconds, found WordClocks at %s",
+                 len(hosts), network, time.monotonic() - started, found)
+    return found
@@ -0,0 +1,202 @@
+"""Client-side transitions and effects for the AWSW WordClock integration."""
+import asyncio
+import logging
+import math
+import time
+from typing import Callable, Dict, Optional, Union
+
+from homeassistant.core import callback
+
+from .const import EFFECT_PERIOD, FRAME_RTT_FACTOR, MIN_FRAME_INTERVAL, PULSE_MIN_LEVEL
+
+LOGGER = logging.getLogger(__name__)
+
+EFFECT_PULSE = "pulse"
+EFFECT_BLINK = "blink"
+WORD_EFFECTS = [EFFECT_PULSE, EFFECT_BLINK]
+
+# "Time" or "Back" for the /config colors, or the id of an extra word.
+Target = Union[str, int]
+Params = Dict[str, int]
+
+
+def _interpolate(start: Params, end: Params, progress: float) -> Params:
+    """Blend two sets of parameters; keys missing in start are taken from end."""
+    return {
+        key: round(start[key] + (value - start[key]) * progress) if key in start else value
+        for key, value in end.items()
+    }
+
+
+class EffectEngine:
+    """Play transitions and effects on one clock as paced frames.
+
+    Each target (Time, Back or a word) runs at most one animation; starting
+    another one or a direct command replaces it. Frames are computed from the
+    elapsed time, so when the device falls behind the frames in between are
+    skipped instead of queued. The next frame is sent only once the previous
+    one was delivered and no sooner than FRAME_RTT_FACTOR times the measured
+    round-trip time. Transitions always end with the exact final value,
+    written like a regular command.
+
+    Frames bypass the coordinator's cache: it holds the final value from the
+    start, and refreshes do not overwrite an animated target. A transition
+    that is stopped early still queues its final value, so the command that
+    interrupts it is merged with it instead of leaving a frame on the device.
+    """
+
+    def __init__(self, coordinator) -> None:
+        """Initialize the engine for the clock of the given coordinator."""
+        self._coordinator = coordinator
+        self._tasks: Dict[Target, asyncio.Task] = {}
+        self._effects: Dict[Target, str] = {}
+        # Final values of the running transitions, sent if they are stopped early.
+        self._finals: Dict[Target, Params] = {}
+        self.frames = 0
+        self.dropped_frames = 0
+
+    @property
+    def frame_interval(self) -> float:
+        """Return the current minimum time between two frames in seconds."""
+        return max(
+            MIN_FRAME_INTERVAL,
+            self._coordinator.commands.min_interval,
+            self._coordinator.rtt * FRAME_RTT_FACTOR,
+        )
+
+    def animating(self, target: Target) -> bool:
+        """Return True while a transition or effect runs on the target."""
+        return target in self._tasks
+
+    def effect(self, target: Target) -> Optional[str]:
+        """Return the effect running on the target, if any."""
+        return self._effects.get(target)
+
+    @callback
+    def async_stop(self, target: Target) -> None:
+        """Stop the animation of a target; a transition queues its final value."""
+        self._effects.pop(target, None)
+        final = self._finals.pop(target, None)
+        task = self._tasks.pop(target, None)
+        if task is None:
+            return
+        task.cancel()
+        if final is not None:
+            # Queued, not sent: a write that follows right away is merged into it.
+            commands = self._coordinator.commands
+            if isinstance(target, int):
+                commands.async_send_word(target, final)
+            else:
+                commands.async_send_config(final)
+
+    @callback
+    def async_stop_all(self) -> None:
+        """Stop all animations of the clock."""
+        for target in list(self._tasks):
+            self.async_stop(target)
+
+    @callback
+    def async_transition(
+        self,
+        target: Target,
+        start: Params,
+        end: Params,
+        duration: float,
+        final: Optional[Params] = None,
+    ) -> None:
+        """Fade a target from start to end over duration seconds, then write final (or end)."""
+        final = end if final is None else final
+        self._async_apply(target, final)
+
+        def frame(elapsed: float) -> Params:
+            return _interpolate(start, end, min(1.0, elapsed / duration))
+
+        self._async_play(target, frame, duration, final)
+        self._finals[target] = final
+
+    @callback
+    def async_start_effect(self, word_id: int, effect: str, params: Params) -> None:
+        """Run an effect on a word until it is stopped; params holds its color."""
+        switch = f"ew{word_id}"
+        rgb = (params["R"], params["G"], params["B"])
+        if effect == EFFECT_PULSE:
+            def frame(elapsed: float) -> Params:
+                wave = 0.5 + 0.5 * math.cos(2 * math.pi * elapsed / EFFECT_PERIOD)
+                level = PULSE_MIN_LEVEL + (1 - PULSE_MIN_LEVEL) * wave
+                return {switch: 1, **{channel: round(value * level) for channel, value in zip("RGB", rgb)}}
+        else:
+            def frame(elapsed: float) -> Params:
+                return {switch: int(elapsed % EFFECT_PERIOD < EFFECT_PERIOD / 2)}
+
+        self._async_play(word_id, frame, None, None)
+        self._effects[word_id] = effect
+
+    @callback
+    def _async_apply(self, target: Target, params: Params) -> None:
+        """Show the final value in the coordinator's cache right away."""
+        if isinstance(target, int):
+            self._coordinator.async_apply_word(target, params)
+        else:
+            self._coordinator.async_apply_config(params)
+
+    @callback
+    def _async_play(
+        self,
+        target: Target,
+        frame: Callable[[float], Params],
+        duration: Optional[float],
+        final: Optional[Params],
+    ) -> None:
+        self.async_stop(target)
+        self._tasks[target] = self._coordinator.hass.async_create_background_task(
+            self._async_run(target, frame, duration, final),
+            f"WordClock {self._coordinator.ip_address} animation {target}",
+        )
+
+    async def _async_run(
+        self,
+        target: Target,
+        frame: Callable[[float], Params],
+        duration: Optional[float],
+        final: Optional[Params],
+    ) -> None:
+        """Send frames until duration is over (forever without one), then final."""
+        started = time.monotonic()
+        last = None
+        try:
+            while duration is None or time.monotonic() - started < duration:
+                sent_at = time.monotonic()
+                params = frame(sent_at - started)
+                if params != last:
+                    await self._async_send_frame(target, params)
+                    last = params
+                    self.frames += 1
+                interval = self.frame_interval
+                late = time.monotonic() - sent_at
+                if late >= 2 * interval:
+                    # The device took longer than the frame slots in between.
+                    self.dropped_frames += int(late / interval) - 1
+                await asyncio.sleep(max(0.0, sent_at + interval - time.monotonic()))
+            if final is not None:
+                # Written below; stopping the task now must not queue it again.
+                self._finals.pop(target, None)
+                if isinstance(target, int):
+                    await self._coordinator.async_write_word(target, final)
+                else:
+                    await self._coordinator.async_write_config(final)
+        finally:
+            if self._tasks.get(target) is asyncio.current_task():
+                self._tasks.pop(target)
+                self._effects.pop(target, None)
+                self._finals.pop(target, None)
+
+    async def _async_send_frame(self, target: Target, params: Params) -> None:
+        """Queue a frame on the command queue and wait until it was sent.
+
+        Frames are not verified and do not hold off the polls of other targets.
+        """
+        commands = self._coordinator.commands
+        if isinstance(target, int):
+            await commands.async_send_word(target, params, frame=True)
+        else:
+            await commands.async_send_config(params, frame=True)
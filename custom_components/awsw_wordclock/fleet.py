@@ -0,0 +1,135 @@
+"""Fleet-wide poll scheduling for the AWSW WordClock integration."""
+import asyncio
+import heapq
+import itertools
+import logging
+import math
+import random
+import time
+from collections import deque
+from contextlib import asynccontextmanager
+from typing import Dict, List, Tuple
+
+from .const import DEFAULT_FLEET_MAX_IN_FLIGHT, FLEET_JITTER
+from .scheduler import PRIORITY_POLL
+
+LOGGER = logging.getLogger(__name__)
+
+
+class FleetScheduler:
+    """Spread the polls of all clocks across their interval.
+
+    Every clock gets a deterministic phase from its position among the
+    registered clocks (sorted by entry id), so n clocks with the same interval
+    poll at offsets of interval / n instead of all at once. A small random
+    jitter keeps them from re-synchronizing. All requests of all clocks share
+    a global cap on requests in flight; its free slots go to the waiting
+    requests in the same priority order as the per-device schedulers, so a
+    command never waits behind the polls of other clocks.
+    """
+
+    def __init__(self, max_in_flight: int = DEFAULT_FLEET_MAX_IN_FLIGHT) -> None:
+        """Initialize the fleet scheduler."""
+        self.max_in_flight = max_in_flight
+        self._queue: List[Tuple[int, int, asyncio.Future]] = []
+        self._counter = itertools.count()
+        self._coordinators: Dict[str, object] = {}
+        self._phases: Dict[str, float] = {}
+        self._poll_starts: deque = deque(maxlen=256)
+        self.in_flight = 0
+        self.max_in_flight_seen = 0
+
+    @property
+    def coordinators(self) -> List:
+        """Return the coordinators of all registered clocks."""
+        return list(self._coordinators.values())
+
+    def get(self, key: str):
+        """Return the coordinator of a registered clock, or None."""
+        return self._coordinators.get(key)
+
+    def register(self, key: str, coordinator) -> None:
+        """Add a clock to the fleet and recompute the phases."""
+        self._coordinators[key] = coordinator
+        self._update_phases()
+
+    def unregister(self, key: str) -> None:
+        """Remove a clock from the fleet and recompute the phases."""
+        self._coordinators.pop(key, None)
+        self._update_phases()
+
+    def _update_phases(self) -> None:
+        keys = sorted(self._coordinators)
+        self._phases = {key: index / len(keys) for index, key in enumerate(keys)}
+        LOGGER.debug("WordClock fleet has %d clocks", len(keys))
+
+    def align(self, key: str, delay: float) -> float:
+        """Move a refresh planned in delay seconds onto the clock's phase slot.
+
+        The slots of a clock lie at k * delay + phase * delay on the monotonic
+        clock, so clocks with the same interval keep evenly spaced offsets.
+        """
+        phase = self._phases.get(key)
+        if phase is None or delay <= 0 or len(self._phases) < 2:
+            return delay
+        now = time.monotonic()
+        offset = phase * delay
+        target = now + delay
+        slot = math.floor((target - offset) / delay + 0.5) * delay + offset
+        # Never poll sooner than half the interval from now.
+        if slot < now + delay / 2:
+            slot += delay
+        return slot - now + random.uniform(0, FLEET_JITTER)
+
+    def note_poll(self) -> None:
+        """Record the start of a poll pass for the spread statistics."""
+        self._poll_starts.append(time.monotonic())
+
+    @asynccontextmanager
+    async def slot(self, priority: int = PRIORITY_POLL):
+        """Hold one of the fleet-wide request slots, served in priority order."""
+        await self._acquire(priority)
+        self.max_in_flight_seen = max(self.max_in_flight_seen, self.in_flight)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int) -> None:
+        if self.in_flight < self.max_in_flight and not self._queue:
+            self.in_flight += 1
+            return
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._counter), waiter))
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over right before the cancellation.
+                self._release()
+            else:
+                self._queue = [item for item in self._queue if item[2] is not waiter]
+                heapq.heapify(self._queue)
+            raise
+
+    def _release(self) -> None:
+        self.in_flight -= 1
+        while self._queue and self.in_flight < self.max_in_flight:
+            _, _, waiter = heapq.heappop(self._queue)
+            if waiter.done():
+                continue
+            self.in_flight += 1
+            waiter.set_result(None)
+
+    @property
+    def stats(self) -> Dict[str, float]:
+        """Return the achieved spread of the recent poll starts."""
+        starts = sorted(self._poll_starts)
+        gaps = [later - earlier for earlier, later in zip(starts, starts[1:])]
+        return {
+            "clocks": len(self._coordinators),
+            "min_gap": round(min(gaps), 3) if gaps else 0.0,
+            "mean_gap": round(sum(gaps) / len(gaps), 3) if gaps else 0.0,
+            "in_flight": self.in_flight,
+            "max_in_flight": self.max_in_flight_seen,
+        }
@@ -1,181 +1,260 @@
 """Platform for WordClock lights."""
+import asyncio
 import logging
-from typing import Any, Tuple
+import time
+from collections import Counter
+from typing import Any, List, Optional, Tuple
 from datetime import timedelta
 
 LOGGER = logging.getLogger(__name__)
 
 from homeassistant.components.light import (
     ATTR_BRIGHTNESS,
+    ATTR_EFFECT,
     ATTR_RGB_COLOR,
+    ATTR_TRANSITION,
     ColorMode,
     LightEntity,
+    LightEntityFeature,
 )
 from homeassistant.config_entries import ConfigEntry
-from homeassistant.core import HomeAssistant
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.exceptions import HomeAssistantError
+from homeassistant.helpers.dispatcher import async_dispatcher_connect
 from homeassistant.helpers.entity import DeviceInfo
 from homeassistant.helpers.event import async_track_time_interval
 from homeassistant.helpers import device_registry as dr, entity_registry as er
 import aiohttp
-import re
-
-from .const import DOMAIN
-
-# Mapping of extra word light texts per language.
-LANGUAGE_WORDS = {
-    "German": {
-        1: "ALARM",
-        2: "GEBURTSTAG",
-        3: "MÜLL RAUS BRINGEN",
-        4: "AUTO",
-        5: "FEIERTAG",
-        6: "FORMEL1",
-        7: "GELBER SACK",
-        8: "URLAUB",
-        9: "WERKSTATT",
-        10: "ZEIT ZUM ZOCKEN",
-        11: "FRISEUR",
-        12: "TERMIN",
-    },
-    "English": {
-        1: "COME HERE",
-        2: "LUNCH TIME",
-        3: "ALARM",
-        4: "GARBAGE",
-        5: "HOLIDAY",
-        6: "TEMPERATURE",
-        7: "DATE",
-        8: "BIRTHDAY",
-        9: "DOORBELL",
-    },
-    "Dutch": {
-        1: "KOM HIER",
-        2: "LUNCH TIJD",
-        3: "ALARM",
-        4: "AFVAL",
-        5: "VAKANTIE",
-        6: "TEMPERATUUR",
-        7: "DATUM",
-        8: "VERJAARDAG",
-        9: "DEURBEL",
-    },
-    "French": {
-        1: "ALARME",
-        2: "ANNIVERSAIRE",
-        3: "POUBELLE",
-        4: "A TABLE",
-        5: "VACANCES",
-        6: "VIENS ICI",
-        7: "SONNETTE",
-        8: "TEMPERATURE",
-        9: "DATE",
-    },
-    "Italian": {
-        1: "VIENI QUI",
-        2: "ORA DI PRANZO",
-        3: "ALLARME",
-        4: "VACANZA",
-        5: "TEMPERATURA",
-        6: "DATA",
-        7: "COMPLEANNO",
-        8: "CAMPANELLO",
-    },
-    "Swedish": {
-        1: "FÖDELSEDAG",
-        2: "LARM",
-        3: "HÖGTID",
-        4: "SEMESTER",
-        5: "LADDA NER",
-        6: "LUNCHTID",
-        7: "KOM HIT",
-        8: "DÖRRKLOCKA",
-        9: "TEMPERATUR",
-    },
-    "Spanish": {
-        1: "CUMPLEAÑOS",
-        2: "ALARMA",
-        3: "VACACIONES",
-        4: "DÍA DE BASURA",
-        5: "FECHA",
-        6: "HORA DE ALMUERZO",
-        7: "VEN AQUÍ",
-        8: "TIMBRE",
-        9: "TEMPERATURA",
-    },
-}
+
+from .const import DATA_FLEET, DOMAIN, SIGNAL_CLOCKS_CHANGED, word_id_for, words_for_language
+from .effects import WORD_EFFECTS
+from .services import async_register_entity
+
+def _word_entity_id(object_id_prefix: str, name: str) -> str:
+    """Return the default entity id of the word light showing name."""
+    return f"light.{object_id_prefix}_word_{name.lower().replace(' ', '_')}"
+
+
+def _device_ids(entry: ConfigEntry) -> Tuple[str, str, str]:
+    """Return the device id, device name and object id prefix of an entry."""
+    ip_address = entry.data["ip_address"]
+    device_name = entry.data.get("name", f"WordClock ({ip_address})")
+    return f"wordclock_{ip_address.replace('.', '_')}", device_name, device_name.lower().replace(' ', '_')
+
 
 async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
     """Set up WordClock lights from a config entry."""
+    if entry.data.get("group"):
+        async_add_entities([WordClockGroupLight(entry)])
+        return
+
     ip_address = entry.data["ip_address"]
     language = entry.options.get("language", entry.data.get("language", "German"))
-    device_id = f"wordclock_{ip_address.replace('.', '_')}"
-
-    device_name = entry.data.get("name", f"WordClock ({ip_address})")
-    object_id_prefix = device_name.lower().replace(' ', '_')
+    device_id, device_name, object_id_prefix = _device_ids(entry)
 
-    session = hass.data[DOMAIN][entry.entry_id]["session"]
-    polling_time = hass.data[DOMAIN][entry.entry_id]["polling_time"]
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
     lights = []
 
     hass.data[DOMAIN][entry.entry_id]["entry"] = entry
+    # Kept for adding word lights when the language changes.
+    hass.data[DOMAIN][entry.entry_id]["async_add_lights"] = async_add_entities
 
     LOGGER.info("Setting up WordClock lights for IP: %s with language: %s", ip_address, language)
 
     # Add the main WordClock lights (time text and background)
     main_lights = [
-        WordClockTimeLight(ip_address, device_id, object_id_prefix, device_name, session),
-        WordClockBackgroundLight(ip_address, device_id, object_id_prefix, device_name, session),
+        WordClockTimeLight(ip_address, device_id, object_id_prefix, device_name, coordinator),
+        WordClockBackgroundLight(ip_address, device_id, object_id_prefix, device_name, coordinator),
     ]
     lights.extend(main_lights)
 
-    # Remove old word entities if language has changed
-    entity_registry = er.async_get(hass)
-    try:
-        existing_entities = er.async_entries_for_device(
-            entity_registry,
-            device_id,
-            include_disabled_entities=True
-        )
-
-        for entity in existing_entities:
-            if entity.entity_id.startswith(f"light.{object_id_prefix}_word_"):
-                try:
-                    entity_registry.async_remove(entity.entity_id)
-                except Exception as e:
-                    LOGGER.error("Error removing entity %s: %s", entity.entity_id, str(e))
-    except Exception as e:
-        LOGGER.error("Error accessing entity registry: %s", str(e))
-
-    # Fetch words for the selected language
-    words = LANGUAGE_WORDS.get(language, {})
-    if not words:
-        LOGGER.error("Language '%s' not found. Using default (German).", language)
-        words = LANGUAGE_WORDS["German"]
-
-    # Add extra word lights
-# Add extra word lights (pass device_name as well)
+    # Word lights keep their registry entries across restarts; they only need
+    # moving if the language changed while this entry was not loaded.
+    words = words_for_language(language)
+    applied_language = entry.data.get("words_language")
+    if applied_language != language:
+        if applied_language is not None:
+            _async_reconcile_registry(
+                hass, device_id, object_id_prefix, words_for_language(applied_language), words
+            )
+        hass.config_entries.async_update_entry(entry, data={**entry.data, "words_language": language})
+
+    # Add extra word lights (pass device_name as well)
     for word_id, word_name in words.items():
-        lights.append(WordClockExtraWordLight(ip_address, word_id, word_name, device_id, object_id_prefix, device_name, session))
-        
-    async_add_entities(lights)
+        lights.append(WordClockExtraWordLight(ip_address, word_id, word_name, device_id, object_id_prefix, device_name, coordinator))
+
+    @callback
+    def _async_registry_updated(event) -> None:
+        """Start polling a word as soon as its light is enabled again.
+
+        Disabled lights are removed from Home Assistant, which drops their
+        word from the refresh passes; nothing has to be done for that here.
+        """
+        if event.data["action"] != "update" or "disabled_by" not in event.data.get("changes", {}):
+            return
+        registry_entry = er.async_get(hass).async_get(event.data["entity_id"])
+        if (registry_entry is None or registry_entry.disabled
+                or registry_entry.config_entry_id != entry.entry_id
+                or not registry_entry.unique_id.startswith(f"{device_id}_word_")):
+            return
+        word_id = int(registry_entry.unique_id.rsplit("_", 1)[1])
+        if word_id in words_for_language(hass.data[DOMAIN][entry.entry_id]["language"]):
+            coordinator.async_set_word_polled(word_id, True)
 
-    # Store entities in hass.data for service access
-    if "entities" not in hass.data[DOMAIN][entry.entry_id]:
-        hass.data[DOMAIN][entry.entry_id]["entities"] = {}
+    entry.async_on_unload(hass.bus.async_listen(er.EVENT_ENTITY_REGISTRY_UPDATED, _async_registry_updated))
 
-    hass.data[DOMAIN][entry.entry_id]["entities"]["light"] = lights
+    # The device's first refresh has been running since the entry started
+    # setting up; wait briefly for its /status so the entities are added with
+    # real state, but not for an offline clock.
+    await coordinator.async_wait_first_refresh()
+    coordinator.async_register_entities(lights)
+    async_add_entities(lights)
     LOGGER.debug("Added %d light entities for WordClock", len(lights))
 
 
-class WordClockBaseLight(LightEntity):
+@callback
+def async_enabled_words(hass: HomeAssistant, entry: ConfigEntry, words) -> list:
+    """Return the ids of the words whose light is not disabled in the registry."""
+    entity_registry = er.async_get(hass)
+    device_id = _device_ids(entry)[0]
+    enabled = []
+    for word_id in words:
+        entity_id = entity_registry.async_get_entity_id("light", DOMAIN, f"{device_id}_word_{word_id}")
+        if entity_id is None or not entity_registry.async_get(entity_id).disabled:
+            enabled.append(word_id)
+    return enabled
+
+
+@callback
+def _async_reconcile_registry(hass: HomeAssistant, device_id, object_id_prefix, old_words, new_words) -> None:
+    """Move the registry entries of the word lights from one word table to another.
+
+    A word light's unique id is its word slot, so it survives a language
+    change. Slots missing from the new table are removed; renamed slots get the
+    entity id of their new word unless the user changed the entity id.
+    """
+    entity_registry = er.async_get(hass)
+    renames = {}
+    for word_id, old_name in old_words.items():
+        entity_id = entity_registry.async_get_entity_id("light", DOMAIN, f"{device_id}_word_{word_id}")
+        if entity_id is None:
+            continue
+        new_name = new_words.get(word_id)
+        if new_name is None:
+            LOGGER.debug("Removing word light %s", entity_id)
+            entity_registry.async_remove(entity_id)
+        elif new_name != old_name and entity_id == _word_entity_id(object_id_prefix, old_name):
+            renames[entity_id] = _word_entity_id(object_id_prefix, new_name)
+
+    # A word may take over the entity id another slot is just moving away
+    # from (e.g. ALARM is slot 1 in German and slot 3 in English).
+    while renames:
+        ready = {old: new for old, new in renames.items() if entity_registry.async_get(new) is None}
+        if not ready:
+            break
+        for old, new in ready.items():
+            LOGGER.debug("Renaming word light %s to %s", old, new)
+            entity_registry.async_update_entity(old, new_entity_id=new)
+            del renames[old]
+    for old, new in renames.items():
+        LOGGER.warning("Keeping entity id %s because %s is already in use", old, new)
+
+
+async def async_change_language(hass: HomeAssistant, entry: ConfigEntry, old_language: str, new_language: str) -> None:
+    """Switch the word lights of a loaded entry to another language in place.
+
+    Only the slots whose word differs are touched: renamed words keep their
+    entity (and history), extra slots are removed and missing ones added.
+    """
+    entry_data = hass.data[DOMAIN][entry.entry_id]
+    coordinator = entry_data["coordinator"]
+    device_id, device_name, object_id_prefix = _device_ids(entry)
+    old_words = words_for_language(old_language)
+    new_words = words_for_language(new_language)
+    current = {
+        light.word_id: light
+        for light in coordinator.entities
+        if isinstance(light, WordClockExtraWordLight)
+    }
+
+    removed = [light for word_id, light in current.items() if word_id not in new_words]
+    coordinator.async_unregister_entities(removed)
+    for light in removed:
+        # Lights disabled in the registry were never added to Home Assistant;
+        # their registry entries are dropped by the reconcile below.
+        if light.hass is not None:
+            await light.async_remove(force_remove=True)
+    renamed = [
+        light for word_id, light in current.items()
+        if word_id in new_words and new_words[word_id] != light.word_name
+    ]
+    for light in renamed:
+        light.async_set_word_name(new_words[light.word_id])
+    _async_reconcile_registry(hass, device_id, object_id_prefix, old_words, new_words)
+
+    added = [
+        WordClockExtraWordLight(entry.data["ip_address"], word_id, word_name, device_id,
+                                object_id_prefix, device_name, coordinator)
+        for word_id, word_name in new_words.items()
+        if word_id not in current
+    ]
+    if added:
+        coordinator.async_register_entities(added)
+        entry_data["async_add_lights"](added)
+    hass.config_entries.async_update_entry(entry, data={**entry.data, "words_language": new_language})
+    LOGGER.info("Changed WordClock %s from %s to %s: %d renamed, %d removed, %d added",
+                entry.data["ip_address"], old_language, new_language,
+                len(renamed), len(removed), len(added))
+
+
+class _PublishedStateMixin:
+    """Write the state of a pushed light only when its published payload changed."""
+
+    _published = None
+
+    def _payload(self) -> tuple:
+        """Return what Home Assistant shows of this light, availability first."""
+        return (self.available, self.is_on, self.rgb_color, self.brightness, self.effect)
+
+    @callback
+    def _async_seed_published(self) -> None:
+        """Remember the state Home Assistant writes right after the entity is added."""
+        self._published = self._payload()
+
+    @callback
+    def _async_publish(self) -> bool:
+        """Write the state unless it equals the last written one; return True if written."""
+        payload = self._payload()
+        if payload == self._published:
+            return False
+        self._published = payload
+        self.async_write_ha_state()
+        return True
+
+    @callback
+    def _async_publish_update(self, applied: bool) -> None:
+        """Publish after a coordinator update that applied a new snapshot to this light.
+
+        Updates that touched neither this light's snapshot nor its availability
+        are skipped; a compared but unchanged payload counts as suppressed.
+        """
+        if not applied and self._published is not None and self._published[0] == self.available:
+            return
+        if not self._async_publish():
+            self._coordinator.suppressed_writes += 1
+
+
+class WordClockBaseLight(_PublishedStateMixin, LightEntity):
     """Base class for WordClock lights, providing common functionality."""
 
 
-    def __init__(self, ip_address, device_id, object_id_prefix, device_name, session):
+    def __init__(self, ip_address, device_id, object_id_prefix, device_name, coordinator):
         """Initialize the light."""
         self._ip_address = ip_address
         self._device_id = device_id
-        self._session = session
+        self._coordinator = coordinator
+        # The status snapshot applied last; a new one replaces the object.
+        self._applied = None
         self._device_name = device_name
         self._state = True  # Start on by default
         self._attr_brightness = 255
@@ -183,7 +262,9 @@ class WordClockBaseLight(LightEntity):
         self._last_rgb_color = (255, 255, 255)
         self._attr_supported_color_modes = {ColorMode.RGB}
         self._attr_color_mode = ColorMode.RGB
-        self._attr_should_poll = True
+        self._attr_supported_features = LightEntityFeature.TRANSITION
+        # State is pushed by the device coordinator, not polled per entity.
+        self._attr_should_poll = False
 
     @property
     def device_info(self) -> DeviceInfo:
@@ -211,59 +292,70 @@ class WordClockBaseLight(LightEntity):
         """Return the RGB color value [int, int, int]."""
         return self._attr_rgb_color
     
-    async def _send_request(self, url):
-        """Send an HTTP GET request to the device; log any errors."""
-        try:
-            LOGGER.debug("Sending request to: %s", url)
-            async with self._session.get(url) as response:
-                if response.status != 200:
-                    LOGGER.error("Failed to send request to %s, HTTP %d", url, response.status)
-                    return False
-                return True
-        except Exception as e:
-            LOGGER.error("Error sending request to %s: %s", url, e)
-            return False
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to status snapshots from the device coordinator."""
+        await super().async_added_to_hass()
+        self.async_on_remove(async_register_entity(self.hass, self))
+        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
+        self._apply_status()
+        self._async_seed_published()
 
-    async def async_update(self) -> None:
-        """Fetch and update state data for this light from /status."""
-        if not hasattr(self, "_color_key_prefix"):
+    @property
+    def coordinator(self):
+        """Return the coordinator of the clock this light belongs to."""
+        return self._coordinator
+
+    @property
+    def available(self) -> bool:
+        """Return False while the device's circuit breaker is open."""
+        return self._coordinator.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply a new status snapshot and publish the state."""
+        self._async_publish_update(self._apply_status())
+
+    def _config_params(self) -> dict:
+        """Return the /config parameters of what this light shows right now."""
+        r, g, b = self._attr_rgb_color if self._state else (0, 0, 0)
+        prefix = self._color_key_prefix
+        return {f"R-{prefix}": r, f"G-{prefix}": g, f"B-{prefix}": b,
+                "INTENSITY": int(self._attr_brightness / 255 * 50)}
+
+    async def _async_write_config(self, start: dict, params: dict, transition) -> None:
+        """Write params, fading from start over transition seconds if given."""
+        effects = self._coordinator.effects
+        if transition:
+            effects.async_transition(self._color_key_prefix, start, params, transition)
             return
-        url = f"http://{self._ip_address}:2023/status"
-        try:
-            async with self._session.get(url) as response:
-                if response.status != 200:
-                    LOGGER.error("Failed to fetch status, HTTP %d", response.status)
-                    return
-                text = await response.text()
-            # Expected status: "R-Time=... G-Time=... B-Time=... R-Back=... G-Back=... B-Back=... INTENSITY=50 ..."
-            status_data = {}
-            for token in text.split():
-                if "=" in token:
-                    key, value = token.split("=", 1)
-                    status_data[key] = value
-            prefix = self._color_key_prefix  # "Time" or "Back"
-            r = int(status_data.get(f"R-{prefix}", "0"))
-            g = int(status_data.get(f"G-{prefix}", "0"))
-            b = int(status_data.get(f"B-{prefix}", "0"))
-            color = (r, g, b)
-            if color != (0, 0, 0):
-                self._last_rgb_color = color
-                LOGGER.debug("Updated last RGB color for %s to %s", self._attr_name, color)
-            self._attr_rgb_color = color
-            # Consider the light off if color is all zeros
-            self._state = not (r == 0 and g == 0 and b == 0)
-            # Update brightness based on INTENSITY (0-50 mapped to 0–255)
-            intensity = int(status_data.get("INTENSITY", "0"))
-            self._attr_brightness = round(intensity / 50 * 255)
-        except Exception as e:
-            LOGGER.error("Error updating WordClock status: %s", e)
+        effects.async_stop(self._color_key_prefix)
+        # Queued writes are coalesced with other pending changes for this device.
+        await self._coordinator.async_write_config(params)
+
+    def _apply_status(self) -> bool:
+        """Update this light from the shared /status snapshot; return True if it is a new one."""
+        status = self._coordinator.status
+        if status is None or status is self._applied or not hasattr(self, "_color_key_prefix"):
+            return False
+        self._applied = status
+        # "Time" or "Back"
+        color = status.time_rgb if self._color_key_prefix == "Time" else status.back_rgb
+        if color != (0, 0, 0):
+            self._last_rgb_color = color
+            LOGGER.debug("Updated last RGB color for %s to %s", self._attr_name, color)
+        self._attr_rgb_color = color
+        # Consider the light off if color is all zeros
+        self._state = color != (0, 0, 0)
+        # Update brightness based on INTENSITY (0-50 mapped to 0–255)
+        self._attr_brightness = status.brightness
+        return True
 
 class WordClockTimeLight(WordClockBaseLight):
     """Light entity for displaying the 'time' (text) on the WordClock."""
 
-    def __init__(self, ip_address: str, device_id, object_id_prefix, device_name, session) -> None:
+    def __init__(self, ip_address: str, device_id, object_id_prefix, device_name, coordinator) -> None:
         """Initialize the light."""
-        super().__init__(ip_address, device_id, object_id_prefix, device_name, session)
+        super().__init__(ip_address, device_id, object_id_prefix, device_name, coordinator)
         self._attr_unique_id = f"{self._device_id}_time"
         self._attr_name = "WordClock Time"
         self.entity_id = f"light.{object_id_prefix}_time"
@@ -274,6 +366,7 @@ class WordClockTimeLight(WordClockBaseLight):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
+        start = self._config_params()
         if ATTR_RGB_COLOR in kwargs:
             self._attr_rgb_color = kwargs[ATTR_RGB_COLOR]
             self._last_rgb_color = self._attr_rgb_color
@@ -283,29 +376,31 @@ class WordClockTimeLight(WordClockBaseLight):
             self._attr_brightness = kwargs[ATTR_BRIGHTNESS]
 
         r, g, b = self._attr_rgb_color
-        url = f"http://{self._ip_address}:2023/config?R-Time={r}&G-Time={g}&B-Time={b}"
+        params = {"R-Time": r, "G-Time": g, "B-Time": b}
         # If brightness is provided, update master intensity (0–50)
         if ATTR_BRIGHTNESS in kwargs:
-            intensity_value = int(self._attr_brightness / 255 * 50)
-            url += f"&INTENSITY={intensity_value}&INTENSITYviaWEB=1"
-        await self._send_request(url)
+            params["INTENSITY"] = int(self._attr_brightness / 255 * 50)
+            params["INTENSITYviaWEB"] = 1
         self._state = True
-        self.async_write_ha_state()
+        self._async_publish()
+        await self._async_write_config(start, params, kwargs.get(ATTR_TRANSITION))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
-        url = f"http://{self._ip_address}:2023/config?R-Time=0&G-Time=0&B-Time=0"
-        await self._send_request(url)
+        start = self._config_params()
         self._state = False
-        self.async_write_ha_state()
+        self._async_publish()
+        await self._async_write_config(
+            start, {"R-Time": 0, "G-Time": 0, "B-Time": 0}, kwargs.get(ATTR_TRANSITION)
+        )
 
 
 class WordClockBackgroundLight(WordClockBaseLight):
     """Light entity for controlling the background color of the WordClock."""
 
-    def __init__(self, ip_address, device_id, object_id_prefix, device_name, session) -> None:
+    def __init__(self, ip_address, device_id, object_id_prefix, device_name, coordinator) -> None:
         """Initialize the background light."""
-        super().__init__(ip_address, device_id, object_id_prefix, device_name, session)
+        super().__init__(ip_address, device_id, object_id_prefix, device_name, coordinator)
         self._attr_unique_id = f"{self._device_id}_background"
         self._attr_name = "WordClock Background"
         self.entity_id = f"light.{object_id_prefix}_background"
@@ -316,6 +411,7 @@ class WordClockBackgroundLight(WordClockBaseLight):
 
     async def async_turn_on(self, **kwargs: Any) -> None:
         """Turn on the light."""
+        start = self._config_params()
         if ATTR_RGB_COLOR in kwargs:
             self._attr_rgb_color = kwargs[ATTR_RGB_COLOR]
             self._last_rgb_color = self._attr_rgb_color
@@ -325,41 +421,48 @@ class WordClockBackgroundLight(WordClockBaseLight):
             self._attr_brightness = kwargs[ATTR_BRIGHTNESS]
 
         r, g, b = self._attr_rgb_color
-        url = f"http://{self._ip_address}:2023/config?R-Back={r}&G-Back={g}&B-Back={b}"
+        params = {"R-Back": r, "G-Back": g, "B-Back": b}
         # If brightness is provided, update master intensity (0–50)
         if ATTR_BRIGHTNESS in kwargs:
-            intensity_value = int(self._attr_brightness / 255 * 50)
-            url += f"&INTENSITY={intensity_value}&INTENSITYviaWEB=1"
-        await self._send_request(url)
+            params["INTENSITY"] = int(self._attr_brightness / 255 * 50)
+            params["INTENSITYviaWEB"] = 1
         self._state = True
-        self.async_write_ha_state()
+        self._async_publish()
+        await self._async_write_config(start, params, kwargs.get(ATTR_TRANSITION))
 
     async def async_turn_off(self, **kwargs: Any) -> None:
         """Turn off the light."""
-        url = f"http://{self._ip_address}:2023/config?R-Back=0&G-Back=0&B-Back=0"
-        await self._send_request(url)
+        start = self._config_params()
         self._state = False
-        self.async_write_ha_state()
+        self._async_publish()
+        await self._async_write_config(
+            start, {"R-Back": 0, "G-Back": 0, "B-Back": 0}, kwargs.get(ATTR_TRANSITION)
+        )
 
 
-class WordClockExtraWordLight(LightEntity):
+class WordClockExtraWordLight(_PublishedStateMixin, LightEntity):
     """Light entity for each extra 'word' LED on the WordClock."""
 
-    def __init__(self, ip_address, word_id, name, device_id, object_id_prefix, device_name, session):
+    def __init__(self, ip_address, word_id, name, device_id, object_id_prefix, device_name, coordinator):
         """Initialize the light."""
         self._ip_address = ip_address
+        self._coordinator = coordinator
+        # The word snapshot applied last; a new one replaces the object.
+        self._applied = None
         self._word_id = word_id
         self._name = name
         self._state = False
         self._device_id = device_id
         self._device_name = device_name
-        self._session = session
         self._rgb_color = (255, 255, 255)  # Default to white
         self._attr_supported_color_modes = {ColorMode.RGB}
         self._attr_color_mode = ColorMode.RGB
+        self._attr_supported_features = LightEntityFeature.TRANSITION | LightEntityFeature.EFFECT
+        self._attr_effect_list = WORD_EFFECTS
         self._attr_unique_id = f"{self._device_id}_word_{self._word_id}"
         self._attr_name = f"WordClock Word {self._name}"
-        self.entity_id = f"light.{object_id_prefix}_word_{name.lower().replace(' ', '_')}"
+        self.entity_id = _word_entity_id(object_id_prefix, name)
+        self._unregister_index = None
 
     @property
     def device_info(self):
@@ -382,92 +485,339 @@ class WordClockExtraWordLight(LightEntity):
         """Return the rgb color value [int, int, int]."""
         return self._rgb_color
 
+    @property
+    def effect(self) -> str | None:
+        """Return the effect running on this word, if any."""
+        return self._coordinator.effects.effect(self._word_id)
+
+    @property
+    def word_id(self) -> int:
+        """Return the slot of this word on the clock."""
+        return self._word_id
+
+    @property
+    def word_name(self) -> str:
+        """Return the word shown by this light, e.g. "ALARM"."""
+        return self._name
+
+    @callback
+    def async_set_word_name(self, name: str) -> None:
+        """Show another word in this slot, e.g. after a language change."""
+        self._name = name
+        self._attr_name = f"WordClock Word {name}"
+        if self._unregister_index is not None:
+            # Re-index under the new word for the services.
+            self._unregister_index()
+            self._unregister_index = async_register_entity(self.hass, self)
+            self.async_write_ha_state()
+
+    @callback
+    def _async_unregister_index(self) -> None:
+        if self._unregister_index is not None:
+            self._unregister_index()
+            self._unregister_index = None
+
     @property
     def should_poll(self) -> bool:
-        """Return True to ensure Home Assistant polls this entity regularly."""
-        return True
+        """Return False; the word state is pushed by the device coordinator."""
+        return False
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to word snapshots from the device coordinator."""
+        await super().async_added_to_hass()
+        self._unregister_index = async_register_entity(self.hass, self)
+        self.async_on_remove(self._async_unregister_index)
+        # Only words with a light in Home Assistant are polled.
+        self._coordinator.async_set_word_polled(self._word_id, True)
+        self.async_on_remove(lambda: self._coordinator.async_set_word_polled(self._word_id, False))
+        self.async_on_remove(self._coordinator.async_add_listener(self._handle_coordinator_update))
+        self._apply_word()
+        self._async_seed_published()
 
-    async def async_update(self):
-        """Fetch and update the current state of the light."""
+    @property
+    def coordinator(self):
+        """Return the coordinator of the clock this light belongs to."""
+        return self._coordinator
 
-        url = f"http://{self._ip_address}:2023/ewstatus/?{self._word_id}"
-        try:
-            async with self._session.get(url) as response:
-                if response.status == 200:
-                    data = await response.text()
-                    # Use regex to extract the first occurrence of 0 or 1 from the reply
-                    match = re.search(r"\b([01])\b", data)
-                    if match:
-                        old_state = self._state
-                        new_state = match.group(1) == "1"
-                        if old_state != new_state:
-                            self._state = new_state
-                            LOGGER.debug("Updated extra word %s state from %s to %s (raw: %s)",
-                                self._word_id, old_state, self._state, data.strip())
-                    else:
-                        LOGGER.error("Unexpected response format for extra word %s: %s",
-                            self._word_id, data.strip())
-                else:
-                    LOGGER.error("Failed to fetch status for extra word %s, HTTP %d",
-                        self._word_id, response.status)
-        except Exception as e:
-            LOGGER.error("Error fetching status for extra word %s: %s", self._word_id, e)
+    @property
+    def available(self) -> bool:
+        """Return False while the device's circuit breaker is open."""
+        return self._coordinator.available
+
+    @callback
+    def _handle_coordinator_update(self) -> None:
+        """Apply a new word snapshot and publish the state."""
+        self._async_publish_update(self._apply_word())
+
+    def _apply_word(self) -> bool:
+        """Update this light from the shared word snapshot; return True if it is a new one."""
+        word = self._coordinator.words.get(self._word_id)
+        if word is None or word is self._applied:
+            return False
+        self._applied = word
+        if word.state != self._state:
+            LOGGER.debug("Updated extra word %s state from %s to %s",
+                self._word_id, self._state, word.state)
+        self._state = word.state
+        self._rgb_color = word.rgb
+        return True
 
-        # Fetch the current RGB color info for the extra word from the /ewrgb endpoint
-        rgb_url = f"http://{self._ip_address}:2023/ewrgb/?{self._word_id}"
-        try:
-            async with self._session.get(rgb_url) as rgb_response:
-                if rgb_response.status == 200:
-                    rgb_text = await rgb_response.text()
-                    # Expecting a format like "R=0 G=0 B=255"
-                    r_match = re.search(r"R=(\d+)", rgb_text)
-                    g_match = re.search(r"G=(\d+)", rgb_text)
-                    b_match = re.search(r"B=(\d+)", rgb_text)
-                    if r_match and g_match and b_match:
-                        r = int(r_match.group(1))
-                        g = int(g_match.group(1))
-                        b = int(b_match.group(1))
-                        self._rgb_color = (r, g, b)
-                        LOGGER.debug("Updated RGB color for extra word %s to %s (raw: %s)",
-                                     self._word_id, self._rgb_color, rgb_text.strip())
-                    else:
-                        LOGGER.error("Unexpected RGB response format for extra word %s: %s",
-                                     self._word_id, rgb_text.strip())
-                else:
-                    LOGGER.error("Failed to fetch RGB color for extra word %s, HTTP %d",
-                                 self._word_id, rgb_response.status)
-        except Exception as e:
-            LOGGER.error("Error fetching RGB color for extra word %s: %s", self._word_id, e)
-    
     async def async_turn_on(self, **kwargs):
         """Turn on the light, updating color and brightness if provided."""
 
-        # Base URL for turning on the word
-        url = f"http://{self._ip_address}:2023/ew/?ew{self._word_id}=1"
+        effects = self._coordinator.effects
+        effect = kwargs.get(ATTR_EFFECT)
+        transition = kwargs.get(ATTR_TRANSITION)
+        start = self._word_params(self._rgb_color if self._state else (0, 0, 0))
+
+        # Base parameters for turning on the word
+        params = {f"ew{self._word_id}": 1}
 
-        # Only add color parameters if color is explicitly provided
+        # Only add color parameters if color is explicitly provided, or when
+        # an animation starts or ends and the device may show another color.
         if ATTR_RGB_COLOR in kwargs:
             self._rgb_color = kwargs[ATTR_RGB_COLOR]
-            r, g, b = self._rgb_color
-            url += f"&R={r}&G={g}&B={b}"
+        if ATTR_RGB_COLOR in kwargs or effect or transition or effects.animating(self._word_id):
+            params = self._word_params(self._rgb_color)
 
-        await self._send_request(url)
         self._state = True
-        self.async_write_ha_state()
+        if effect in WORD_EFFECTS:
+            # Stop first: a stopped transition queues its final value, which must not override params.
+            effects.async_stop(self._word_id)
+            write = self._coordinator.async_write_word(self._word_id, params)
+            effects.async_start_effect(self._word_id, effect, params)
+            self._async_publish()
+            await write
+        elif transition:
+            effects.async_transition(self._word_id, start, params, transition)
+            self._async_publish()
+        else:
+            effects.async_stop(self._word_id)
+            self._async_publish()
+            await self._coordinator.async_write_word(self._word_id, params)
 
     async def async_turn_off(self, **kwargs):
         """Turn off the light."""
-
-        url = f"http://{self._ip_address}:2023/ew/?ew{self._word_id}=0"
-        await self._send_request(url)
+        effects = self._coordinator.effects
+        transition = kwargs.get(ATTR_TRANSITION)
+        start = self._word_params(self._rgb_color)
+        params = {f"ew{self._word_id}": 0}
+        if transition or effects.animating(self._word_id):
+            # Leave the word's own color on the device, not a faded one.
+            params.update(zip("RGB", self._rgb_color))
+
+        was_on = self._state
         self._state = False
-        self.async_write_ha_state()
+        if transition and was_on:
+            # Fade to black while on, then switch off.
+            effects.async_transition(self._word_id, start, self._word_params((0, 0, 0)), transition, params)
+            self._async_publish()
+        else:
+            effects.async_stop(self._word_id)
+            self._async_publish()
+            await self._coordinator.async_write_word(self._word_id, params)
+
+    def _word_params(self, rgb) -> dict:
+        """Return the /ew/ parameters that show this word on in the given color."""
+        r, g, b = rgb
+        return {f"ew{self._word_id}": 1, "R": r, "G": g, "B": b}
+
+
+class WordClockGroupLight(_PublishedStateMixin, LightEntity):
+    """Light spanning the time, background or one word of several clocks.
+
+    The state is computed from the member clocks' snapshots, so the group adds
+    no requests of its own. Commands are queued on every member at once and
+    sent concurrently, bounded by the fleet-wide request slots; a command takes
+    as long as the slowest member.
+    """
+
+    def __init__(self, entry: ConfigEntry) -> None:
+        """Initialize the group light."""
+        self._entry = entry
+        self._target = entry.data["target"]
+        self._word = entry.data.get("word")
+        self._member_ids = entry.data["members"]
+        # /config color key prefix of time and background groups, None for words
+        self._color_key_prefix = {"time": "Time", "background": "Back"}.get(self._target)
+        self._queueing = False
+        self._unsub_members = []
+        self._state = False
+        self._attr_brightness = 255 if self._target != "word" else None
+        self._attr_rgb_color = (255, 255, 255)
+        self._last_rgb_color = (255, 255, 255)
+        self._attr_supported_color_modes = {ColorMode.RGB}
+        self._attr_color_mode = ColorMode.RGB
+        self._attr_unique_id = f"{entry.entry_id}_group"
+        self._attr_name = entry.data["name"]
+        # State is pushed by the member coordinators, not polled.
+        self._attr_should_poll = False
+
+    @property
+    def is_on(self) -> bool:
+        """Return true if the light is on on any member clock."""
+        return self._state
+
+    @property
+    def rgb_color(self) -> Tuple[int, int, int]:
+        """Return the color most of the lit members show."""
+        return self._attr_rgb_color
 
-    async def _send_request(self, url):
-        """Send request to device."""
+    @property
+    def available(self) -> bool:
+        """Return True while any member clock is reachable."""
+        return any(coordinator.available for coordinator, _ in self._members())
+
+    @property
+    def extra_state_attributes(self):
+        """Return the member clocks."""
+        return {"members": [coordinator.ip_address for coordinator, _ in self._members()]}
+
+    def _members(self) -> List[Tuple[Any, Optional[int]]]:
+        """Return (coordinator, word id) of every loaded member clock.
+
+        The word id is looked up in each member's current language and is None
+        for time and background groups. Members that are not loaded, or whose
+        language lacks the word, are left out.
+        """
+        fleet = self.hass.data[DOMAIN][DATA_FLEET]
+        members = []
+        for entry_id in self._member_ids:
+            coordinator = fleet.get(entry_id)
+            if coordinator is None:
+                continue
+            word_id = None
+            if self._target == "word":
+                word_id = word_id_for(self.hass.data[DOMAIN][entry_id]["language"], self._word)
+                if word_id is None:
+                    continue
+            members.append((coordinator, word_id))
+        return members
+
+    async def async_added_to_hass(self) -> None:
+        """Subscribe to the snapshots of the member clocks."""
+        await super().async_added_to_hass()
+        self.async_on_remove(self._async_unsubscribe_members)
+        self.async_on_remove(async_dispatcher_connect(self.hass, SIGNAL_CLOCKS_CHANGED, self._async_clocks_changed))
+        self._async_subscribe_members()
+        self._apply_members()
+        self._async_seed_published()
+
+    @callback
+    def _async_subscribe_members(self) -> None:
+        self._async_unsubscribe_members()
+        self._unsub_members = [
+            coordinator.async_add_listener(self._handle_member_update) for coordinator, _ in self._members()
+        ]
+
+    @callback
+    def _async_unsubscribe_members(self) -> None:
+        for unsub in self._unsub_members:
+            unsub()
+        self._unsub_members = []
+
+    @callback
+    def _async_clocks_changed(self) -> None:
+        """Follow member clocks that were set up or unloaded."""
+        self._async_subscribe_members()
+        self._handle_member_update()
+
+    @callback
+    def _handle_member_update(self) -> None:
+        """Recompute the state from the member snapshots and publish it."""
+        if self._queueing:
+            # A fan-out is applying its command to every member; publish once after it.
+            return
+        self._apply_members()
+        self._async_publish()
+
+    def _apply_members(self) -> None:
+        """Update this light from the cached member snapshots."""
+        colors = []
+        brightness = []
+        for coordinator, word_id in self._members():
+            if self._target == "word":
+                word = coordinator.words.get(word_id)
+                if word is not None and word.state:
+                    colors.append(word.rgb)
+                continue
+            status = coordinator.status
+            if status is None:
+                continue
+            color = status.time_rgb if self._target == "time" else status.back_rgb
+            if color != (0, 0, 0):
+                colors.append(color)
+            brightness.append(status.brightness)
+        self._state = bool(colors)
+        if colors:
+            self._last_rgb_color = Counter(colors).most_common(1)[0][0]
+        self._attr_rgb_color = self._last_rgb_color
+        if brightness:
+            self._attr_brightness = round(sum(brightness) / len(brightness))
+
+    async def async_turn_on(self, **kwargs: Any) -> None:
+        """Turn the light on on all member clocks."""
+        if ATTR_RGB_COLOR in kwargs:
+            self._last_rgb_color = tuple(kwargs[ATTR_RGB_COLOR])
+        r, g, b = self._last_rgb_color
+        if self._target == "word":
+            await self._async_fan_out(lambda word_id, _: {f"ew{word_id}": 1, "R": r, "G": g, "B": b})
+            return
+        prefix = self._color_key_prefix
+        params = {f"R-{prefix}": r, f"G-{prefix}": g, f"B-{prefix}": b}
+        if ATTR_BRIGHTNESS in kwargs:
+            params["INTENSITY"] = int(kwargs[ATTR_BRIGHTNESS] / 255 * 50)
+            params["INTENSITYviaWEB"] = 1
+        await self._async_fan_out(lambda *_: params)
+
+    async def async_turn_off(self, **kwargs: Any) -> None:
+        """Turn the light off on all member clocks."""
+        if self._target == "word":
+
+            def word_off(word_id, coordinator):
+                params = {f"ew{word_id}": 0}
+                word = coordinator.words.get(word_id)
+                if coordinator.effects.animating(word_id) and word is not None:
+                    # Leave the word's own color on the device, not an animated one.
+                    params.update(zip("RGB", word.rgb))
+                return params
+
+            await self._async_fan_out(word_off)
+            return
+        prefix = self._color_key_prefix
+        await self._async_fan_out(lambda *_: {f"R-{prefix}": 0, f"G-{prefix}": 0, f"B-{prefix}": 0})
+
+    async def _async_fan_out(self, make_params) -> None:
+        """Queue a command on every member clock and wait until all have sent it.
+
+        make_params(word_id, coordinator) returns the parameters for one
+        member. The writes are queued synchronously, so the members' snapshots
+        change together and the group publishes a single state.
+        """
+        started = time.monotonic()
+        members = self._members()
+        writes = []
+        self._queueing = True
         try:
-            async with self._session.get(url) as response:
-                if response.status != 200:
-                    LOGGER.error("Failed to send request to %s, HTTP %d", url, response.status)
-        except Exception as e:
-            LOGGER.error("Error sending request to %s: %s", url, e)
\ No newline at end of file
+            for coordinator, word_id in members:
+                params = make_params(word_id, coordinator)
+                if word_id is None:
+                    coordinator.effects.async_stop(self._color_key_prefix)
+                    writes.append(coordinator.async_write_config(params))
+                else:
+                    coordinator.effects.async_stop(word_id)
+                    writes.append(coordinator.async_write_word(word_id, params))
+        finally:
+            self._queueing = False
+        self._apply_members()
+        self._async_publish()
+
+        # A write resolves to False when it could not be sent, e.g. while the breaker is open.
+        results = await asyncio.gather(*writes, return_exceptions=True)
+        failed = [coordinator for (coordinator, _), result in zip(members, results) if result is not True]
+        for coordinator in failed:
+            LOGGER.warning("Group %s could not update WordClock %s", self._attr_name, coordinator.ip_address)
+        LOGGER.debug("Group %s updated %d of %d clocks in %.3f seconds",
+                     self._attr_name, len(members) - len(failed), len(members), time.monotonic() - started)
+        if failed and len(failed) == len(members):
+            raise HomeAssistantError(f"{self._attr_name} could not update any of its WordClocks")
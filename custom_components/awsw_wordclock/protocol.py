@@ -0,0 +1,95 @@
+"""Parsers for the AWSW WordClock HTTP protocol."""
+import re
+from typing import Dict, NamedTuple, Tuple
+
+RGB = Tuple[int, int, int]
+
+# /ewstatus/?N replies with the word state as a bare 0 or 1.
+_EWSTATUS_RE = re.compile(r"\b([01])\b")
+
+
+class ProtocolError(ValueError):
+    """Raised when a device reply does not match the expected format."""
+
+
+class StatusSnapshot(NamedTuple):
+    """Parsed state of the /status endpoint of a WordClock."""
+
+    time_rgb: RGB
+    back_rgb: RGB
+    intensity: int
+
+    @property
+    def brightness(self) -> int:
+        """Return the master intensity (0–50) mapped to 0–255."""
+        return round(self.intensity / 50 * 255)
+
+
+class WordSnapshot(NamedTuple):
+    """State of a single extra word from /ewstatus and /ewrgb."""
+
+    state: bool
+    rgb: RGB
+
+
+def _rgb(r: str, g: str, b: str) -> RGB:
+    rgb = (int(r), int(g), int(b))
+    if not 0 <= min(rgb) <= max(rgb) <= 255:
+        raise ProtocolError(f"Color {rgb} out of range 0-255")
+    return rgb
+
+
+def _key_values(text: str) -> Dict[str, str]:
+    """Split "KEY=value KEY=value ..." into a dict in one pass.
+
+    str.split and str.partition run in C and beat a regex scan of the same
+    reply by about a factor of two (see scripts/bench_protocol.py).
+    """
+    values = {}
+    for token in text.split():
+        key, _, value = token.partition("=")
+        values[key] = value
+    return values
+
+
+def parse_status(text: str) -> StatusSnapshot:
+    """Parse a /status reply like "R-Time=255 G-Time=0 ... INTENSITY=50".
+
+    Other keys in the reply are ignored. Raises ProtocolError if a color
+    channel or INTENSITY is missing, not a number or out of range.
+    """
+    values = _key_values(text)
+    try:
+        time_rgb = _rgb(values["R-Time"], values["G-Time"], values["B-Time"])
+        back_rgb = _rgb(values["R-Back"], values["G-Back"], values["B-Back"])
+        intensity = int(values["INTENSITY"])
+    except KeyError as e:
+        raise ProtocolError(f"Status reply is missing {e.args[0]}: {text.strip()[:100]}") from e
+    except ValueError as e:
+        raise ProtocolError(f"Invalid status reply: {text.strip()[:100]}") from e
+    if not 0 <= intensity <= 50:
+        raise ProtocolError(f"INTENSITY {intensity} out of range 0-50")
+    return StatusSnapshot(time_rgb, back_rgb, intensity)
+
+
+def parse_ewstatus(text: str) -> bool:
+    """Parse a /ewstatus reply into the word's on/off state.
+
+    Raises ProtocolError if the reply contains no 0 or 1.
+    """
+    match = _EWSTATUS_RE.search(text)
+    if match is None:
+        raise ProtocolError(f"Unexpected word status reply: {text.strip()[:100]}")
+    return match.group(1) == "1"
+
+
+def parse_ewrgb(text: str) -> RGB:
+    """Parse a /ewrgb reply like "R=0 G=0 B=255" into an RGB tuple.
+
+    Raises ProtocolError if a channel is missing, not a number or out of range.
+    """
+    values = _key_values(text)
+    try:
+        return _rgb(values["R"], values["G"], values["B"])
+    except (KeyError, ValueError) as e:
+        raise ProtocolError(f"Unexpected word color reply: {text.strip()[:100]}") from e
@@ -0,0 +1,154 @@
+"""Priority-aware request scheduler for the AWSW WordClock integration."""
+import asyncio
+import heapq
+import itertools
+import logging
+import time
+from contextlib import asynccontextmanager
+from typing import Dict, List, Tuple
+
+from .const import DEFAULT_MAX_CONNECTIONS
+
+LOGGER = logging.getLogger(__name__)
+
+# Priority classes, lower values are served first.
+PRIORITY_COMMAND = 0
+PRIORITY_VERIFY = 1
+PRIORITY_POLL = 2
+
+PRIORITY_NAMES = {
+    PRIORITY_COMMAND: "command",
+    PRIORITY_VERIFY: "verify",
+    PRIORITY_POLL: "poll",
+}
+
+
+class RequestDropped(Exception):
+    """Raised for a queued poll that became stale before it was sent."""
+
+
+class _ClassStats:
+    """Queue statistics of one priority class."""
+
+    __slots__ = ("depth", "max_depth", "requests", "dropped", "wait_total", "wait_max")
+
+    def __init__(self) -> None:
+        self.depth = 0
+        self.max_depth = 0
+        self.requests = 0
+        self.dropped = 0
+        self.wait_total = 0.0
+        self.wait_max = 0.0
+
+    def as_dict(self) -> Dict[str, float]:
+        return {
+            "queue_depth": self.depth,
+            "max_queue_depth": self.max_depth,
+            "requests": self.requests,
+            "dropped": self.dropped,
+            "avg_wait": round(self.wait_total / self.requests, 4) if self.requests else 0.0,
+            "max_wait": round(self.wait_max, 4),
+        }
+
+
+class RequestScheduler:
+    """Hand out a small connection budget to requests in priority order.
+
+    The clocks handle one connection at a time, so every request to a device
+    first acquires a slot here. Interactive commands are served before
+    verification reads, which are served before routine polls. Queued polls
+    of a target (the /config values or one word) are dropped as soon as a
+    command for that target is waiting, since the command is about to change
+    the state they would read; polls of other targets keep their place.
+    """
+
+    def __init__(self, max_connections: int = DEFAULT_MAX_CONNECTIONS) -> None:
+        """Initialize the scheduler."""
+        self.max_connections = max_connections
+        self._active = 0
+        self._queue: List[Tuple[int, int, asyncio.Future, object]] = []
+        self._counter = itertools.count()
+        self._stats = {priority: _ClassStats() for priority in PRIORITY_NAMES}
+
+    @property
+    def stats(self) -> Dict[str, Dict[str, float]]:
+        """Return queue depth and wait time per priority class."""
+        return {PRIORITY_NAMES[priority]: stats.as_dict() for priority, stats in self._stats.items()}
+
+    @asynccontextmanager
+    async def slot(self, priority: int, target=None):
+        """Hold one connection slot for the duration of a request.
+
+        target is what the request reads or writes. A command drops the queued
+        polls of its target; animation frames pass no target, as they leave
+        the state the polls read alone. Raises RequestDropped for a poll that
+        was discarded while queued.
+        """
+        await self._acquire(priority, target)
+        try:
+            yield
+        finally:
+            self._release()
+
+    async def _acquire(self, priority: int, target) -> None:
+        stats = self._stats[priority]
+        if priority == PRIORITY_COMMAND and target is not None:
+            self._drop_polls(target)
+        if self._active < self.max_connections and not self._queue:
+            self._active += 1
+            stats.requests += 1
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        heapq.heappush(self._queue, (priority, next(self._counter), waiter, target))
+        stats.depth += 1
+        stats.max_depth = max(stats.max_depth, stats.depth)
+        start = time.monotonic()
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled() and waiter.exception() is None:
+                # The slot was handed over right before the cancellation.
+                self._release()
+            else:
+                self._remove(waiter, stats)
+            raise
+        finally:
+            waited = time.monotonic() - start
+            stats.wait_total += waited
+            stats.wait_max = max(stats.wait_max, waited)
+        stats.requests += 1
+
+    def _release(self) -> None:
+        self._active -= 1
+        while self._queue and self._active < self.max_connections:
+            priority, _, waiter, _ = heapq.heappop(self._queue)
+            self._stats[priority].depth -= 1
+            if waiter.done():
+                continue
+            self._active += 1
+            waiter.set_result(None)
+
+    def _remove(self, waiter: asyncio.Future, stats: _ClassStats) -> None:
+        for index, item in enumerate(self._queue):
+            if item[2] is waiter:
+                self._queue.pop(index)
+                heapq.heapify(self._queue)
+                stats.depth -= 1
+                return
+
+    def _drop_polls(self, target) -> None:
+        """Fail the queued polls of a target so the command does not wait behind stale reads."""
+        kept = []
+        for item in self._queue:
+            priority, _, waiter, poll_target = item
+            if priority == PRIORITY_POLL and poll_target == target and not waiter.done():
+                stats = self._stats[priority]
+                stats.depth -= 1
+                stats.dropped += 1
+                waiter.set_exception(RequestDropped())
+            else:
+                kept.append(item)
+        if len(kept) != len(self._queue):
+            heapq.heapify(kept)
+            self._queue = kept
@@ -0,0 +1,90 @@
+"""Diagnostic sensors for WordClock performance telemetry."""
+import logging
+from datetime import timedelta
+from typing import Callable
+
+from homeassistant.components.sensor import SensorEntity, SensorStateClass
+from homeassistant.config_entries import ConfigEntry
+from homeassistant.const import PERCENTAGE, EntityCategory, UnitOfTime
+from homeassistant.core import HomeAssistant
+from homeassistant.helpers.entity import DeviceInfo
+
+from .const import DOMAIN
+
+LOGGER = logging.getLogger(__name__)
+
+# The sensors only read in-memory counters; once a minute is plenty.
+SCAN_INTERVAL = timedelta(seconds=60)
+
+# key, name, unit, enabled by default, value of the coordinator
+SENSORS = [
+    ("requests", "Requests", None, False, lambda c: c.telemetry.total_requests),
+    ("success_rate", "Request success rate", PERCENTAGE, True, lambda c: c.telemetry.success_rate),
+    ("latency_p50", "Latency p50", UnitOfTime.MILLISECONDS, False, lambda c: c.telemetry.latency(50)),
+    ("latency_p95", "Latency p95", UnitOfTime.MILLISECONDS, True, lambda c: c.telemetry.latency(95)),
+    ("latency_p99", "Latency p99", UnitOfTime.MILLISECONDS, False, lambda c: c.telemetry.latency(99)),
+    ("poll_cycle", "Poll cycle duration", UnitOfTime.SECONDS, True, lambda c: c.telemetry.last_cycle),
+    ("coalesced_writes", "Coalesced writes", None, False, lambda c: c.commands.coalesced),
+    ("suppressed_writes", "Suppressed state writes", None, False, lambda c: c.suppressed_writes),
+]
+
+
+async def async_setup_entry(hass: HomeAssistant, entry: ConfigEntry, async_add_entities):
+    """Set up the telemetry sensors of a WordClock."""
+    ip_address = entry.data["ip_address"]
+    device_id = f"wordclock_{ip_address.replace('.', '_')}"
+    device_name = entry.data.get("name", f"WordClock ({ip_address})")
+    coordinator = hass.data[DOMAIN][entry.entry_id]["coordinator"]
+
+    sensors = [
+        WordClockTelemetrySensor(ip_address, device_id, device_name, coordinator, *sensor)
+        for sensor in SENSORS
+    ]
+    coordinator.async_register_entities(sensors)
+    async_add_entities(sensors)
+
+
+class WordClockTelemetrySensor(SensorEntity):
+    """Diagnostic sensor showing one telemetry figure of a WordClock."""
+
+    _attr_entity_category = EntityCategory.DIAGNOSTIC
+    _attr_state_class = SensorStateClass.MEASUREMENT
+
+    def __init__(self, ip_address, device_id, device_name, coordinator, key, name, unit, enabled,
+                 value: Callable) -> None:
+        """Initialize the sensor."""
+        self._ip_address = ip_address
+        self._device_id = device_id
+        self._device_name = device_name
+        self._coordinator = coordinator
+        self._key = key
+        self._value = value
+        self._attr_unique_id = f"{device_id}_{key}"
+        self._attr_name = f"WordClock {name}"
+        self._attr_native_unit_of_measurement = unit
+        self._attr_entity_registry_enabled_default = enabled
+        if key in ("requests", "coalesced_writes", "suppressed_writes"):
+            self._attr_state_class = SensorStateClass.TOTAL_INCREASING
+
+    @property
+    def device_info(self) -> DeviceInfo:
+        """Return device information."""
+        return {
+            "identifiers": {(DOMAIN, self._device_id)},
+            "name": self._device_name,
+            "manufacturer": "AWSW",
+            "model": "WordClock",
+            "configuration_url": f"http://{self._ip_address}",
+        }
+
+    @property
+    def extra_state_attributes(self):
+        """Return the per-endpoint counts on the requests sensor."""
+        if self._key != "requests":
+            return None
+        telemetry = self._coordinator.telemetry
+        return {"endpoints": dict(telemetry.requests), "failures": dict(telemetry.failures)}
+
+    async def async_update(self) -> None:
+        """Read the current figure from the device telemetry."""
+        self._attr_native_value = self._value(self._coordinator)
@@ -1,58 +1,256 @@
 """Services for AWSW WordClock integration."""
+import asyncio
+import json
 import logging
+from datetime import datetime
 import voluptuous as vol
 
-from homeassistant.core import HomeAssistant, ServiceCall
+from homeassistant.core import CALLBACK_TYPE, HomeAssistant, ServiceCall, callback
 from homeassistant.helpers import config_validation as cv
-from homeassistant.components.light import ATTR_RGB_COLOR
+from homeassistant.components.light import ATTR_BRIGHTNESS, ATTR_RGB_COLOR
 
-from .const import DOMAIN
+from .const import (
+    DATA_ENTITY_INDEX,
+    DATA_FLEET,
+    DATA_SNAPSHOTS,
+    DATA_TRACER,
+    DATA_WORD_INDEX,
+    DOMAIN,
+)
+from .tracing import Tracer
 
 LOGGER = logging.getLogger(__name__)
 
 SERVICE_SET_WORD_COLOR = "set_word_color"
+SERVICE_SET_WORDS = "set_words"
+SERVICE_SNAPSHOT = "snapshot"
+SERVICE_RESTORE = "restore"
+SERVICE_PROFILE = "profile"
+
+RGB_COLOR_SCHEMA = vol.All(
+    vol.ExactSequence((cv.byte, cv.byte, cv.byte)),
+    vol.Coerce(tuple),
+)
+BRIGHTNESS_SCHEMA = vol.All(vol.Coerce(int), vol.Range(min=0, max=255))
 
 SERVICE_SET_WORD_COLOR_SCHEMA = vol.Schema({
     vol.Required("entity_id"): cv.entity_id,
-    vol.Required(ATTR_RGB_COLOR): vol.All(
-        vol.ExactSequence((cv.byte, cv.byte, cv.byte)),
-        vol.Coerce(tuple),
+    vol.Required(ATTR_RGB_COLOR): RGB_COLOR_SCHEMA,
+    vol.Optional(ATTR_BRIGHTNESS): BRIGHTNESS_SCHEMA,
+})
+
+SERVICE_SET_WORDS_SCHEMA = vol.Schema({
+    vol.Required("targets"): vol.All(
+        cv.ensure_list,
+        [
+            vol.All(
+                vol.Schema({
+                    vol.Exclusive("entity_id", "target"): cv.entity_id,
+                    vol.Exclusive("word", "target"): cv.string,
+                    vol.Optional("state", default=True): cv.boolean,
+                    vol.Optional(ATTR_RGB_COLOR): RGB_COLOR_SCHEMA,
+                    vol.Optional(ATTR_BRIGHTNESS): BRIGHTNESS_SCHEMA,
+                }),
+                cv.has_at_least_one_key("entity_id", "word"),
+            )
+        ],
     ),
 })
 
+SERVICE_SCENE_SCHEMA = vol.Schema({
+    vol.Optional("name", default="default"): cv.string,
+    vol.Optional("entity_id"): cv.entity_ids,
+})
+
+SERVICE_PROFILE_SCHEMA = vol.Schema({
+    vol.Optional("duration", default=30): vol.All(vol.Coerce(int), vol.Range(min=1, max=3600)),
+})
+
+
+def _write_profile(path: str, data: dict) -> None:
+    """Write a profile to a JSON file (runs in the executor)."""
+    with open(path, "w", encoding="utf-8") as profile:
+        json.dump(data, profile, indent=1)
+
+
+def _word_key(word: str) -> str:
+    """Normalize a word name for lookups ("Müll raus bringen" == "MÜLL RAUS BRINGEN")."""
+    return word.casefold()
+
+
+@callback
+def async_register_entity(hass: HomeAssistant, entity) -> CALLBACK_TYPE:
+    """Add an entity to the integration-wide indexes; return a function that removes it.
+
+    Entities are indexed by entity_id and, for extra words, by word name, so
+    the services can resolve their targets without scanning every entry.
+    """
+    entity_index = hass.data[DOMAIN].setdefault(DATA_ENTITY_INDEX, {})
+    word_index = hass.data[DOMAIN].setdefault(DATA_WORD_INDEX, {})
+    entity_id = entity.entity_id
+    entity_index[entity_id] = entity
+    word = getattr(entity, "word_name", None)
+    if word is not None:
+        word_index.setdefault(_word_key(word), {})[entity_id] = entity
+
+    @callback
+    def unregister() -> None:
+        if entity_index.get(entity_id) is entity:
+            entity_index.pop(entity_id)
+        if word is not None:
+            entities = word_index.get(_word_key(word), {})
+            if entities.get(entity_id) is entity:
+                entities.pop(entity_id)
+            if not entities:
+                word_index.pop(_word_key(word), None)
+
+    return unregister
+
+
 async def async_setup_services(hass: HomeAssistant):
     """Set up services for AWSW WordClock integration."""
-    
+    entity_index = hass.data[DOMAIN].setdefault(DATA_ENTITY_INDEX, {})
+    word_index = hass.data[DOMAIN].setdefault(DATA_WORD_INDEX, {})
+
     async def async_handle_word_color(call: ServiceCall):
-        """Handle the service call to set word color."""
+        """Handle the service call to set the word color (and optionally brightness)."""
         entity_id = call.data["entity_id"]
-        rgb_color = call.data[ATTR_RGB_COLOR]
-        
-        entity = hass.states.get(entity_id)
-        if not entity:
-            LOGGER.error("Entity %s not found", entity_id)
+        entity = entity_index.get(entity_id)
+        if entity is None:
+            LOGGER.error("Entity %s not found or doesn't support color/brightness", entity_id)
             return
-            
-        # Find entity in registry and call its turn_on method with the color
-        for component in hass.data.get(DOMAIN, {}).values():
-            if "light" in component:
-                for entity_obj in component["light"]:
-                    if entity_obj.entity_id == entity_id:
-                        await entity_obj.async_turn_on(**{ATTR_RGB_COLOR: rgb_color})
-                        return
-                            
-        LOGGER.error("Could not find entity object for %s", entity_id)
-    
+
+        kwargs = {ATTR_RGB_COLOR: call.data[ATTR_RGB_COLOR]}
+        if ATTR_BRIGHTNESS in call.data:
+            kwargs[ATTR_BRIGHTNESS] = call.data[ATTR_BRIGHTNESS]
+        LOGGER.debug("Setting color for %s to %s", entity_id, kwargs)
+        await entity.async_turn_on(**kwargs)
+
+    async def async_handle_set_words(call: ServiceCall):
+        """Set many WordClock lights at once, sending the writes per clock concurrently."""
+        per_clock = {}
+        for target in call.data["targets"]:
+            if "entity_id" in target:
+                entities = [entity_index.get(target["entity_id"])]
+            else:
+                entities = list(word_index.get(_word_key(target["word"]), {}).values())
+            entities = [entity for entity in entities if entity is not None]
+            if not entities:
+                LOGGER.error("No WordClock light found for %s",
+                             target.get("entity_id", target.get("word")))
+                continue
+
+            kwargs = {}
+            if ATTR_RGB_COLOR in target:
+                kwargs[ATTR_RGB_COLOR] = target[ATTR_RGB_COLOR]
+            if ATTR_BRIGHTNESS in target:
+                kwargs[ATTR_BRIGHTNESS] = target[ATTR_BRIGHTNESS]
+            for entity in entities:
+                if target["state"]:
+                    action = entity.async_turn_on(**kwargs)
+                else:
+                    action = entity.async_turn_off()
+                per_clock.setdefault(entity.coordinator, []).append(action)
+
+        # Each clock's command queue merges the writes it receives; the clocks
+        # themselves are written to concurrently.
+        await asyncio.gather(*(asyncio.gather(*actions) for actions in per_clock.values()))
+
+    def _async_coordinators(call: ServiceCall):
+        """Return the clocks of the given entities, or all clocks if none are given."""
+        if "entity_id" not in call.data:
+            return hass.data[DOMAIN][DATA_FLEET].coordinators
+        coordinators = []
+        for entity_id in call.data["entity_id"]:
+            entity = entity_index.get(entity_id)
+            if entity is None:
+                LOGGER.error("Entity %s not found", entity_id)
+            elif entity.coordinator not in coordinators:
+                coordinators.append(entity.coordinator)
+        return coordinators
+
+    async def async_handle_snapshot(call: ServiceCall):
+        """Capture the full state of the selected clocks under a name."""
+        snapshots = hass.data[DOMAIN].setdefault(DATA_SNAPSHOTS, {}).setdefault(call.data["name"], {})
+        for coordinator in _async_coordinators(call):
+            snapshots[coordinator.ip_address] = coordinator.async_snapshot()
+
+    async def async_handle_restore(call: ServiceCall):
+        """Restore a named snapshot with as few requests as possible."""
+        snapshots = hass.data[DOMAIN].get(DATA_SNAPSHOTS, {}).get(call.data["name"])
+        if snapshots is None:
+            LOGGER.error("No WordClock snapshot named %s", call.data["name"])
+            return
+        restores = [
+            coordinator.async_restore(snapshots[coordinator.ip_address])
+            for coordinator in _async_coordinators(call)
+            if coordinator.ip_address in snapshots
+        ]
+        await asyncio.gather(*restores)
+
+    async def async_run_profile(tracer: Tracer, duration: int) -> None:
+        """Trace all clocks for duration seconds and write the result to a file."""
+        coordinators = hass.data[DOMAIN][DATA_FLEET].coordinators
+        for coordinator in coordinators:
+            coordinator.tracer = tracer
+        try:
+            await asyncio.sleep(duration)
+        finally:
+            for coordinator in coordinators:
+                coordinator.tracer = None
+            hass.data[DOMAIN].pop(DATA_TRACER, None)
+        path = hass.config.path(f"{DOMAIN}_profile_{datetime.now():%Y%m%d_%H%M%S}.json")
+        await hass.async_add_executor_job(_write_profile, path, tracer.as_dict())
+        LOGGER.info("Wrote WordClock profile of %d clocks with %d traces to %s",
+                    len(coordinators), len(tracer.records), path)
+
+    async def async_handle_profile(call: ServiceCall):
+        """Start tracing all clocks for a number of seconds in the background."""
+        if DATA_TRACER in hass.data[DOMAIN]:
+            LOGGER.error("A WordClock profile is already running")
+            return
+        tracer = hass.data[DOMAIN][DATA_TRACER] = Tracer()
+        LOGGER.info("Profiling WordClocks for %d seconds", call.data["duration"])
+        hass.async_create_background_task(
+            async_run_profile(tracer, call.data["duration"]), "WordClock profile"
+        )
+
     hass.services.async_register(
         DOMAIN,
         SERVICE_SET_WORD_COLOR,
         async_handle_word_color,
         schema=SERVICE_SET_WORD_COLOR_SCHEMA,
     )
-    
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SET_WORDS,
+        async_handle_set_words,
+        schema=SERVICE_SET_WORDS_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_SNAPSHOT,
+        async_handle_snapshot,
+        schema=SERVICE_SCENE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_RESTORE,
+        async_handle_restore,
+        schema=SERVICE_SCENE_SCHEMA,
+    )
+    hass.services.async_register(
+        DOMAIN,
+        SERVICE_PROFILE,
+        async_handle_profile,
+        schema=SERVICE_PROFILE_SCHEMA,
+    )
+
     return True
-    
+
+
 async def async_unload_services(hass: HomeAssistant):
     """Unload services for AWSW WordClock integration."""
-    if hass.services.has_service(DOMAIN, SERVICE_SET_WORD_COLOR):
-        hass.services.async_remove(DOMAIN, SERVICE_SET_WORD_COLOR)
\ No newline at end of file
+    for service in (SERVICE_SET_WORD_COLOR, SERVICE_SET_WORDS, SERVICE_SNAPSHOT, SERVICE_RESTORE, SERVICE_PROFILE):
+        if hass.services.has_service(DOMAIN, service):
+            hass.services.async_remove(DOMAIN, service)
@@ -0,0 +1,122 @@
+"""Persisted last known state of the AWSW WordClocks."""
+import logging
+from typing import Callable, Dict
+
+from homeassistant.core import HomeAssistant, callback
+from homeassistant.helpers.storage import Store
+
+from .const import STATE_SAVE_DELAY, STORAGE_KEY, STORAGE_VERSION
+from .protocol import StatusSnapshot, WordSnapshot
+
+LOGGER = logging.getLogger(__name__)
+
+
+def _encode(snapshot) -> dict:
+    """Turn a clock snapshot into JSON-serializable data."""
+    status = snapshot.status
+    return {
+        "status": None if status is None else {
+            "time_rgb": list(status.time_rgb),
+            "back_rgb": list(status.back_rgb),
+            "intensity": status.intensity,
+        },
+        "words": {
+            str(word_id): {"state": word.state, "rgb": list(word.rgb)}
+            for word_id, word in snapshot.words.items()
+        },
+    }
+
+
+def _decode(data: dict):
+    """Turn stored data back into the status and word snapshots."""
+    status = data.get("status")
+    if status is not None:
+        status = StatusSnapshot(tuple(status["time_rgb"]), tuple(status["back_rgb"]), status["intensity"])
+    words = {
+        int(word_id): WordSnapshot(word["state"], tuple(word["rgb"]))
+        for word_id, word in data.get("words", {}).items()
+    }
+    return status, words
+
+
+class StateStore:
+    """Keep the last known state of every clock across restarts.
+
+    All clocks share one storage file. A change of any clock schedules a
+    single delayed save, so a poll pass of many clocks costs one write at most
+    every STATE_SAVE_DELAY seconds; Home Assistant writes pending data on
+    shutdown.
+    """
+
+    def __init__(self, hass: HomeAssistant) -> None:
+        """Initialize the store."""
+        self._store = Store(hass, STORAGE_VERSION, STORAGE_KEY)
+        self._data: Dict[str, dict] = {}
+        self._coordinators: Dict[str, object] = {}
+        self._unsub_listeners: Dict[str, Callable[[], None]] = {}
+        self._saved: Dict[str, object] = {}
+        self._save_pending = False
+
+    async def async_load(self) -> None:
+        """Load the stored state of all clocks."""
+        data = await self._store.async_load() or {}
+        self._data = data.get("clocks", {})
+
+    @callback
+    def async_register(self, key: str, coordinator) -> None:
+        """Fill a coordinator's cache from the stored state and track its changes."""
+        self._coordinators[key] = coordinator
+        self._unsub_listeners[key] = coordinator.async_add_listener(lambda: self.async_schedule_save(key))
+        if key not in self._data:
+            return
+        try:
+            status, words = _decode(self._data[key])
+        except (KeyError, TypeError, ValueError) as e:
+            LOGGER.warning("Ignoring invalid stored state of WordClock %s: %s", coordinator.ip_address, e)
+            return
+        coordinator.async_set_cache(status, words)
+        self._saved[key] = coordinator.async_snapshot()
+
+    @callback
+    def async_unregister(self, key: str) -> None:
+        """Stop tracking a clock; its last state stays stored."""
+        self.async_schedule_save(key)
+        unsub = self._unsub_listeners.pop(key, None)
+        if unsub is not None:
+            unsub()
+        coordinator = self._coordinators.pop(key, None)
+        if coordinator is not None:
+            self._data[key] = _encode(coordinator.async_snapshot())
+
+    @callback
+    def async_remove(self, key: str) -> None:
+        """Forget the stored state of a removed clock."""
+        self.async_unregister(key)
+        self._saved.pop(key, None)
+        if self._data.pop(key, None) is not None:
+            self._async_delay_save()
+
+    @callback
+    def async_schedule_save(self, key: str) -> None:
+        """Save the clock's state with the next batch if it changed."""
+        coordinator = self._coordinators.get(key)
+        if coordinator is None or coordinator.async_snapshot() == self._saved.get(key):
+            return
+        self._async_delay_save()
+
+    @callback
+    def _async_delay_save(self) -> None:
+        # A pending save is not pushed back, so frequent changes cannot starve it.
+        if not self._save_pending:
+            self._save_pending = True
+            self._store.async_delay_save(self._data_to_save, STATE_SAVE_DELAY)
+
+    @callback
+    def _data_to_save(self) -> dict:
+        """Collect the current state of all clocks for the storage file."""
+        self._save_pending = False
+        for key, coordinator in self._coordinators.items():
+            snapshot = coordinator.async_snapshot()
+            self._saved[key] = snapshot
+            self._data[key] = _encode(snapshot)
+        return {"clocks": self._data}
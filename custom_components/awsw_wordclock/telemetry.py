@@ -0,0 +1,94 @@
+"""Request and poll telemetry of a single AWSW WordClock."""
+from collections import Counter, deque
+from typing import Dict, Iterable, Optional
+
+from .const import TELEMETRY_WINDOW
+
+
+def endpoint(path: str) -> str:
+    """Return the endpoint of a request path without its query ("/ewrgb/?3" -> "/ewrgb/")."""
+    return path.partition("?")[0]
+
+
+def percentile(samples: Iterable[float], percent: float) -> Optional[float]:
+    """Return the nearest-rank percentile of the samples, or None without samples."""
+    ordered = sorted(samples)
+    if not ordered:
+        return None
+    rank = max(0, min(len(ordered) - 1, round(percent / 100 * len(ordered)) - 1))
+    return ordered[rank]
+
+
+class DeviceTelemetry:
+    """Count the requests of one clock and keep rolling latency windows.
+
+    Counters run since setup. Latencies and poll-cycle durations are kept for
+    the last TELEMETRY_WINDOW requests and cycles, so the percentiles follow
+    the current behavior of the clock instead of averaging over days.
+    """
+
+    def __init__(self, window: int = TELEMETRY_WINDOW) -> None:
+        """Initialize empty counters."""
+        self.requests: Counter = Counter()
+        self.failures: Counter = Counter()
+        self.latencies: deque = deque(maxlen=window)
+        self.cycle_durations: deque = deque(maxlen=window)
+        self.cycles = 0
+
+    def record_request(self, path: str, elapsed: float, success: bool) -> None:
+        """Record one request; only successful ones count towards the latency."""
+        name = endpoint(path)
+        self.requests[name] += 1
+        if success:
+            self.latencies.append(elapsed)
+        else:
+            self.failures[name] += 1
+
+    def record_cycle(self, elapsed: float) -> None:
+        """Record the duration of one refresh pass."""
+        self.cycles += 1
+        self.cycle_durations.append(elapsed)
+
+    @property
+    def total_requests(self) -> int:
+        """Return the number of requests since setup."""
+        return sum(self.requests.values())
+
+    @property
+    def success_rate(self) -> Optional[float]:
+        """Return the share of successful requests in percent."""
+        total = self.total_requests
+        if not total:
+            return None
+        return round(100 * (total - sum(self.failures.values())) / total, 2)
+
+    def latency(self, percent: float) -> Optional[float]:
+        """Return a round-trip latency percentile in milliseconds."""
+        value = percentile(self.latencies, percent)
+        return None if value is None else round(value * 1000, 1)
+
+    @property
+    def last_cycle(self) -> Optional[float]:
+        """Return the duration of the last refresh pass in seconds."""
+        return round(self.cycle_durations[-1], 3) if self.cycle_durations else None
+
+    def as_dict(self) -> Dict[str, object]:
+        """Return all figures, e.g. for the diagnostics download."""
+        cycle_p95 = percentile(self.cycle_durations, 95)
+        return {
+            "requests": dict(self.requests),
+            "failures": dict(self.failures),
+            "success_rate": self.success_rate,
+            "latency_ms": {
+                "p50": self.latency(50),
+                "p95": self.latency(95),
+                "p99": self.latency(99),
+                "samples": len(self.latencies),
+            },
+            "cycle_seconds": {
+                "count": self.cycles,
+                "last": self.last_cycle,
+                "p95": None if cycle_p95 is None else round(cycle_p95, 3),
+                "samples": len(self.cycle_durations),
+            },
+        }
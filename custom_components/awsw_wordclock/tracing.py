@@ -0,0 +1,93 @@
+"""On-demand request tracing for the AWSW WordClock integration."""
+import contextvars
+import time
+from collections import deque
+from typing import Dict, Optional
+
+from .const import TRACE_BUFFER_SIZE
+from .scheduler import PRIORITY_NAMES
+from .telemetry import endpoint, percentile
+
+# The trace of the request the current task sent last; the steps that follow
+# a request in the same task (parsing, publishing) add their times to it.
+_current: contextvars.ContextVar = contextvars.ContextVar("wordclock_trace", default=None)
+
+TIMINGS = ("queue_wait", "network", "parse", "state_write")
+
+
+class Tracer:
+    """Collect traces of all clocks in a bounded ring buffer while profiling runs.
+
+    The coordinators only hold a tracer while profiling is on; otherwise their
+    hot paths skip tracing after a single None check.
+    """
+
+    def __init__(self, size: int = TRACE_BUFFER_SIZE) -> None:
+        """Initialize an empty ring buffer."""
+        self.records: deque = deque(maxlen=size)
+        self.seen = 0
+        self._started = time.monotonic()
+        self.started_at = time.time()
+
+    def _append(self, record: dict) -> dict:
+        self.seen += 1
+        self.records.append(record)
+        return record
+
+    def start_request(self, clock: str, path: str, priority: int) -> dict:
+        """Start the trace of a request and make it the current one of this task."""
+        record = self._append({
+            "at": round(time.monotonic() - self._started, 4),
+            "kind": "request",
+            "clock": clock,
+            "endpoint": endpoint(path),
+            "priority": PRIORITY_NAMES[priority],
+            "ok": None,
+            **dict.fromkeys(TIMINGS),
+        })
+        _current.set(record)
+        return record
+
+    def note(self, key: str, value) -> None:
+        """Add a step to the current request trace of this task, if any."""
+        record = _current.get()
+        if record is not None:
+            record[key] = value
+
+    def record_event(self, kind: str, clock: str, seconds: float, **extra) -> None:
+        """Record a step that is not tied to a request, e.g. a poll cycle."""
+        self._append({
+            "at": round(time.monotonic() - self._started, 4),
+            "kind": kind,
+            "clock": clock,
+            "seconds": seconds,
+            **extra,
+        })
+
+    def summary(self) -> Dict[str, Dict[str, Optional[float]]]:
+        """Return count, mean and p95 of every timing per endpoint and event kind."""
+        groups: Dict[str, list] = {}
+        for record in self.records:
+            key = record["endpoint"] if record["kind"] == "request" else record["kind"]
+            groups.setdefault(key, []).append(record)
+        summary = {}
+        for key, records in groups.items():
+            figures = {"count": len(records)}
+            for timing in (*TIMINGS, "seconds"):
+                values = [record[timing] for record in records if record.get(timing) is not None]
+                if values:
+                    figures[f"{timing}_mean"] = round(sum(values) / len(values), 6)
+                    figures[f"{timing}_p95"] = round(percentile(values, 95), 6)
+            summary[key] = figures
+        return summary
+
+    def as_dict(self) -> dict:
+        """Return the summary and the buffered traces, e.g. for writing to a file."""
+        return {
+            "started_at": self.started_at,
+            "duration": round(time.monotonic() - self._started, 3),
+            "traces_seen": self.seen,
+            "traces_kept": len(self.records),
+            "summary": self.summary(),
+            "traces": list(self.records),
+        }
@@ -0,0 +1,83 @@
+"""Microbenchmarks of the WordClock protocol parsers.
+
+Compares the parsers in protocol.py with the parsing they replaced: a
+split/dict pass per Time and Background entity for /status (two per cycle)
+and uncompiled re.search calls per word for /ewstatus and /ewrgb.
+
+Usage:
+    python scripts/bench_protocol.py [--number 100000]
+
+protocol.py has no Home Assistant imports, so this runs in any Python 3.
+"""
+import argparse
+import importlib.util
+import os
+import re
+import timeit
+
+_PATH = os.path.join(
+    os.path.dirname(__file__), "..", "custom_components", "awsw_wordclock", "protocol.py"
+)
+_spec = importlib.util.spec_from_file_location("wordclock_protocol", _PATH)
+protocol = importlib.util.module_from_spec(_spec)
+_spec.loader.exec_module(protocol)
+
+STATUS = (
+    "R-Time=255 G-Time=0 B-Time=0 R-Back=110 G-Back=140 B-Back=255 "
+    "INTENSITY=50 INTENSITYviaWEB=1 LANGUAGE=0 DISPLAYOFF=0"
+)
+EWSTATUS = "1"
+EWRGB = "R=0 G=128 B=255"
+
+
+def legacy_status(text):
+    # The Time and Background lights each parsed the full reply.
+    result = []
+    for prefix in ("Time", "Back"):
+        status_data = {}
+        for token in text.split():
+            if "=" in token:
+                key, value = token.split("=", 1)
+                status_data[key] = value
+        result.append((
+            int(status_data.get(f"R-{prefix}", "0")),
+            int(status_data.get(f"G-{prefix}", "0")),
+            int(status_data.get(f"B-{prefix}", "0")),
+            int(status_data.get("INTENSITY", "0")),
+        ))
+    return result
+
+
+def legacy_ewstatus(text):
+    return re.search(r"\b([01])\b", text).group(1) == "1"
+
+
+def legacy_ewrgb(text):
+    r_match = re.search(r"R=(\d+)", text)
+    g_match = re.search(r"G=(\d+)", text)
+    b_match = re.search(r"B=(\d+)", text)
+    return int(r_match.group(1)), int(g_match.group(1)), int(b_match.group(1))
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--number", type=int, default=100000)
+    args = parser.parse_args()
+
+    cases = [
+        ("/status", legacy_status, protocol.parse_status, STATUS),
+        ("/ewstatus", legacy_ewstatus, protocol.parse_ewstatus, EWSTATUS),
+        ("/ewrgb", legacy_ewrgb, protocol.parse_ewrgb, EWRGB),
+    ]
+    print(f"{'reply':<10} {'legacy us':>10} {'protocol us':>12} {'speedup':>8}")
+    for name, legacy, current, text in cases:
+        legacy_time = min(timeit.repeat(lambda: legacy(text), number=args.number, repeat=3))
+        current_time = min(timeit.repeat(lambda: current(text), number=args.number, repeat=3))
+        print(
+            f"{name:<10} {legacy_time / args.number * 1e6:>10.2f} "
+            f"{current_time / args.number * 1e6:>12.2f} {legacy_time / current_time:>7.2f}x"
+        )
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,196 @@
+"""End-to-end performance benchmark of the integration against emulated clocks.
+
+Starts a Home Assistant core with the integration from this repository, adds
+one config entry per emulated clock and reports for every fleet size:
+
+- requests per refresh pass and device, and verification reads after writes,
+- command-to-device latency of light.turn_on (service call until the clock
+  received the final color),
+- event-loop lag (how late a 50 ms timer fires),
+- entity state writes per minute.
+
+Each clock listens on its own loopback address 127.0.0.N:2023, which works
+out of the box on Linux.
+
+Usage:
+    python scripts/benchmark.py [--clocks 1 10 100] [--duration 60] [--polling-time 5]
+        [--latency 0.05] [--jitter 0.02] [--failure-rate 0.0] [--single-connection]
+
+Requires a Home Assistant development environment.
+"""
+import argparse
+import asyncio
+import os
+import statistics
+import sys
+import tempfile
+import time
+
+sys.path.insert(0, os.path.dirname(__file__))
+
+from fake_wordclock import FakeWordClock  # noqa: E402
+from homeassistant import bootstrap  # noqa: E402
+from homeassistant.const import EVENT_STATE_CHANGED  # noqa: E402
+from homeassistant.runner import RuntimeConfig  # noqa: E402
+
+DOMAIN = "awsw_wordclock"
+REPO_ROOT = os.path.abspath(os.path.join(os.path.dirname(__file__), ".."))
+
+
+def _percentile(values, percent):
+    if not values:
+        return 0.0
+    values = sorted(values)
+    return values[min(len(values) - 1, int(len(values) * percent / 100))]
+
+
+async def _measure_loop_lag(stop: asyncio.Event, samples: list) -> None:
+    """Record how late a 50 ms sleep wakes up until stop is set."""
+    while not stop.is_set():
+        start = time.monotonic()
+        await asyncio.sleep(0.05)
+        samples.append(time.monotonic() - start - 0.05)
+
+
+async def _wait_for_request(device: FakeWordClock, query: str, since: float, timeout: float) -> float:
+    """Return the time the device received a request containing query."""
+    deadline = time.monotonic() + timeout
+    while time.monotonic() < deadline:
+        for received, path in device.log:
+            if received >= since and query in path:
+                return received
+        await asyncio.sleep(0.01)
+    return float("nan")
+
+
+def _poll_counts(coordinators) -> tuple:
+    """Return the refresh passes, poll requests and verification reads of all clocks so far."""
+    cycles = sum(coordinator.telemetry.cycles for coordinator in coordinators)
+    polls = sum(coordinator.scheduler.stats["poll"]["requests"] for coordinator in coordinators)
+    verifies = sum(coordinator.scheduler.stats["verify"]["requests"] for coordinator in coordinators)
+    return cycles, polls, verifies
+
+
+async def run_fleet(args, clocks: int) -> dict:
+    """Benchmark one fleet size and return the measured figures."""
+    devices = [
+        FakeWordClock(
+            latency=args.latency,
+            jitter=args.jitter,
+            failure_rate=args.failure_rate,
+            single_connection=args.single_connection,
+        )
+        for _ in range(clocks)
+    ]
+    for index, device in enumerate(devices):
+        await device.start(host=f"127.0.0.{index + 2}", port=2023)
+
+    config_dir = tempfile.mkdtemp(prefix="wordclock-bench-")
+    os.symlink(os.path.join(REPO_ROOT, "custom_components"), os.path.join(config_dir, "custom_components"))
+    with open(os.path.join(config_dir, "configuration.yaml"), "w", encoding="utf-8") as config:
+        config.write("homeassistant:\n")
+
+    hass = await bootstrap.async_setup_hass(RuntimeConfig(config_dir=config_dir, skip_pip=True))
+    await hass.async_start()
+
+    state_writes = 0
+
+    def count_write(event):
+        nonlocal state_writes
+        if event.data["entity_id"].startswith("light."):
+            state_writes += 1
+
+    try:
+        for index in range(clocks):
+            await hass.config_entries.flow.async_init(
+                DOMAIN,
+                context={"source": "user"},
+                data={
+                    "ip_address": f"127.0.0.{index + 2}",
+                    "name": f"Bench {index}",
+                    "language": "German",
+                    "polling_time": args.polling_time,
+                },
+            )
+        await hass.async_block_till_done()
+
+        for device in devices:
+            device.requests.clear()
+            device.log.clear()
+        coordinators = hass.data[DOMAIN]["fleet"].coordinators
+        baseline = _poll_counts(coordinators)
+        unsub = hass.bus.async_listen(EVENT_STATE_CHANGED, count_write)
+        stop = asyncio.Event()
+        lag_samples = []
+        lag_task = asyncio.create_task(_measure_loop_lag(stop, lag_samples))
+
+        # Fire one color command per clock at a steady pace during the run.
+        latencies = []
+        started = time.monotonic()
+        step = args.duration / max(1, clocks)
+        for index, device in enumerate(devices):
+            await asyncio.sleep(max(0.0, started + index * step - time.monotonic()))
+            color = (index % 256, 128, 255 - index % 256)
+            issued = time.monotonic()
+            await hass.services.async_call(
+                "light",
+                "turn_on",
+                {"entity_id": f"light.bench_{index}_time", "rgb_color": color},
+                blocking=False,
+            )
+            query = f"R-Time={color[0]}&G-Time={color[1]}&B-Time={color[2]}"
+            received = await _wait_for_request(device, query, issued, timeout=args.duration)
+            latencies.append(received - issued)
+        await asyncio.sleep(max(0.0, started + args.duration - time.monotonic()))
+        elapsed = time.monotonic() - started
+
+        stop.set()
+        await lag_task
+        unsub()
+
+        cycles, poll_requests, verify_requests = (
+            after - before for after, before in zip(_poll_counts(coordinators), baseline)
+        )
+        return {
+            "clocks": clocks,
+            "requests_per_cycle": poll_requests / cycles if cycles else 0.0,
+            "verify_requests": verify_requests,
+            "latency_p50": statistics.median(latencies) if latencies else 0.0,
+            "latency_max": max(latencies) if latencies else 0.0,
+            "loop_lag_p99": _percentile(lag_samples, 99),
+            "loop_lag_max": max(lag_samples) if lag_samples else 0.0,
+            "state_writes_per_minute": state_writes / elapsed * 60,
+        }
+    finally:
+        await hass.async_stop()
+        for device in devices:
+            await device.stop()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--clocks", type=int, nargs="+", default=[1, 10, 100])
+    parser.add_argument("--duration", type=float, default=60.0)
+    parser.add_argument("--polling-time", type=int, default=5)
+    parser.add_argument("--latency", type=float, default=0.05)
+    parser.add_argument("--jitter", type=float, default=0.02)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--single-connection", action="store_true")
+    args = parser.parse_args()
+
+    print(
+        f"{'clocks':>6} {'req/cycle':>10} {'verifies':>9} {'cmd p50 s':>10} {'cmd max s':>10} "
+        f"{'lag p99 s':>10} {'lag max s':>10} {'writes/min':>11}"
+    )
+    for clocks in args.clocks:
+        result = await run_fleet(args, clocks)
+        print(
+            f"{result['clocks']:>6} {result['requests_per_cycle']:>10.1f} {result['verify_requests']:>9} "
+            f"{result['latency_p50']:>10.3f} {result['latency_max']:>10.3f} "
+            f"{result['loop_lag_p99']:>10.4f} {result['loop_lag_max']:>10.4f} "
+            f"{result['state_writes_per_minute']:>11.1f}"
+        )
+
+
+if __name__ == "__main__":
+    asyncio.run(main())
@@ -0,0 +1,175 @@
+"""Fake AWSW WordClock device for counting requests per poll cycle.
+
+Starts a local HTTP server that answers the WordClock API (/status, /ewstatus,
+/ewrgb, /config and /ew) and drives the integration's coordinator against it,
+printing how many requests each poll cycle sends to every endpoint. The fake
+device can add latency, jitter and random failures and can serve a single
+connection at a time like the ESP firmware; scripts/benchmark.py uses it to
+emulate whole fleets of clocks.
+
+Usage:
+    python scripts/fake_wordclock.py [--words 12] [--cycles 3] [--max-connections 1]
+        [--latency 0.05] [--jitter 0.02] [--failure-rate 0.0] [--single-connection]
+
+Requires aiohttp and homeassistant to be importable (a Home Assistant dev
+environment).
+"""
+import argparse
+import asyncio
+import os
+import random
+import sys
+import time
+from collections import Counter
+
+from aiohttp import web
+
+sys.path.insert(0, os.path.join(os.path.dirname(__file__), ".."))
+
+from custom_components.awsw_wordclock.client import WordClockClient  # noqa: E402
+from custom_components.awsw_wordclock.coordinator import WordClockCoordinator  # noqa: E402
+
+
+class FakeWordClock:
+    """Minimal in-memory WordClock that counts the requests it receives."""
+
+    def __init__(
+        self,
+        words: int = 12,
+        latency: float = 0.0,
+        jitter: float = 0.0,
+        failure_rate: float = 0.0,
+        single_connection: bool = False,
+    ) -> None:
+        """Initialize the fake device state and its network behaviour."""
+        self.latency = latency
+        self.jitter = jitter
+        self.failure_rate = failure_rate
+        self.time_rgb = [255, 0, 0]
+        self.back_rgb = [110, 140, 255]
+        self.intensity = 50
+        self.words = {word_id: [False, [255, 255, 255]] for word_id in range(1, words + 1)}
+        self.requests = Counter()
+        # (monotonic time, path with query) of every handled request.
+        self.log = []
+        self._connection_lock = asyncio.Lock() if single_connection else None
+        self.in_flight = 0
+        self.max_in_flight = 0
+        self.app = web.Application(middlewares=[self._count])
+        self.app.router.add_get("/status", self._status)
+        self.app.router.add_get("/config", self._config)
+        self.app.router.add_get("/ew/", self._ew)
+        self.app.router.add_get("/ewstatus/", self._ewstatus)
+        self.app.router.add_get("/ewrgb/", self._ewrgb)
+        self._runner = None
+
+    @web.middleware
+    async def _count(self, request, handler):
+        if self._connection_lock is None:
+            return await self._handle(request, handler)
+        # The firmware serves one connection at a time; the others wait.
+        async with self._connection_lock:
+            return await self._handle(request, handler)
+
+    async def _handle(self, request, handler):
+        self.requests[request.path] += 1
+        self.in_flight += 1
+        self.max_in_flight = max(self.max_in_flight, self.in_flight)
+        try:
+            delay = self.latency + random.uniform(-self.jitter, self.jitter)
+            if delay > 0:
+                await asyncio.sleep(delay)
+            if random.random() < self.failure_rate:
+                return web.Response(status=500, text="ERROR")
+            response = await handler(request)
+            self.log.append((time.monotonic(), request.path_qs))
+            return response
+        finally:
+            self.in_flight -= 1
+
+    def _word_id(self, request) -> int:
+        return int(request.query_string)
+
+    async def _status(self, request):
+        r, g, b = self.time_rgb
+        br, bg, bb = self.back_rgb
+        return web.Response(text=(
+            f"R-Time={r} G-Time={g} B-Time={b} "
+            f"R-Back={br} G-Back={bg} B-Back={bb} INTENSITY={self.intensity}"
+        ))
+
+    async def _config(self, request):
+        for index, channel in enumerate("RGB"):
+            if f"{channel}-Time" in request.query:
+                self.time_rgb[index] = int(request.query[f"{channel}-Time"])
+            if f"{channel}-Back" in request.query:
+                self.back_rgb[index] = int(request.query[f"{channel}-Back"])
+        if "INTENSITY" in request.query:
+            self.intensity = int(request.query["INTENSITY"])
+        return web.Response(text="OK")
+
+    async def _ew(self, request):
+        for key, value in request.query.items():
+            if key.startswith("ew"):
+                word = self.words[int(key[2:])]
+                word[0] = value == "1"
+                if "R" in request.query:
+                    word[1] = [int(request.query[c]) for c in "RGB"]
+        return web.Response(text="OK")
+
+    async def _ewstatus(self, request):
+        return web.Response(text="1" if self.words[self._word_id(request)][0] else "0")
+
+    async def _ewrgb(self, request):
+        r, g, b = self.words[self._word_id(request)][1]
+        return web.Response(text=f"R={r} G={g} B={b}")
+
+    async def start(self, host: str = "127.0.0.1", port: int = 0) -> int:
+        """Start serving and return the bound port."""
+        self._runner = web.AppRunner(self.app)
+        await self._runner.setup()
+        site = web.TCPSite(self._runner, host, port)
+        await site.start()
+        return self._runner.addresses[0][1]
+
+    async def stop(self) -> None:
+        """Stop serving."""
+        if self._runner is not None:
+            await self._runner.cleanup()
+
+
+async def main() -> None:
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--words", type=int, default=12)
+    parser.add_argument("--cycles", type=int, default=3)
+    parser.add_argument("--max-connections", type=int, default=1)
+    parser.add_argument("--latency", type=float, default=0.0)
+    parser.add_argument("--jitter", type=float, default=0.0)
+    parser.add_argument("--failure-rate", type=float, default=0.0)
+    parser.add_argument("--single-connection", action="store_true")
+    args = parser.parse_args()
+
+    device = FakeWordClock(
+        args.words, args.latency, args.jitter, args.failure_rate, args.single_connection
+    )
+    port = await device.start()
+    try:
+        client = WordClockClient("127.0.0.1", port=port, max_connections=args.max_connections)
+        coordinator = WordClockCoordinator(None, client)
+        coordinator.async_set_words(device.words)
+        for cycle in range(1, args.cycles + 1):
+            device.requests.clear()
+            device.max_in_flight = 0
+            await coordinator.async_refresh()
+            counts = ", ".join(f"{path}={count}" for path, count in sorted(device.requests.items()))
+            print(
+                f"cycle {cycle}: {sum(device.requests.values())} requests "
+                f"({counts}), max in flight {device.max_in_flight}"
+            )
+        await client.async_close()
+    finally:
+        await device.stop()
+
+
+if __name__ == "__main__":
+    asyncio.run(main())